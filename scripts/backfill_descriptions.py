@@ -2,6 +2,7 @@
 
 import asyncio
 import logging
+import random
 import sys
 from pathlib import Path
 
@@ -9,14 +10,17 @@ sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
 from playwright.async_api import async_playwright
 from src.db.job_db import JobDatabase
-from src.scrapers.linkedin_browser import GUEST_DETAIL_SELECTORS
+from src.scrapers.linkedin_browser import (
+    USER_AGENT,
+    LinkedInRateLimitError,
+    fetch_guest_description,
+    guest_posting_url,
+)
 from src.scrapers.linkedin_parser import extract_job_description
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s")
 logger = logging.getLogger(__name__)
 
-USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-
 
 async def backfill():
     db = JobDatabase()
@@ -38,9 +42,9 @@ async def backfill():
 
     logger.info("Backfilling %d LinkedIn jobs via guest API", len(rows))
 
+    # The guest endpoint is plain HTML over HTTP: no Chromium needed.
     pw = await async_playwright().start()
-    browser = await pw.chromium.launch(headless=True)
-    page = await browser.new_page(user_agent=USER_AGENT)
+    request = await pw.request.new_context(user_agent=USER_AGENT)
 
     success = 0
     failed = 0
@@ -48,31 +52,13 @@ async def backfill():
     for row in rows:
         job_id = row["id"]
         url = row["url"]
-        import re
-        match = re.search(r"/jobs/view/(\d+)", url)
-        if not match:
+        if not guest_posting_url(url):
             logger.warning("Cannot extract job ID from URL: %s", url)
             failed += 1
             continue
 
-        guest_url = f"https://www.linkedin.com/jobs-guest/jobs/api/jobPosting/{match.group(1)}"
         try:
-            resp = await page.goto(guest_url, wait_until="domcontentloaded", timeout=15000)
-            if not resp or resp.status != 200:
-                logger.warning("Guest API returned %s for %s", resp.status if resp else "None", url)
-                failed += 1
-                continue
-
-            payload = {"json_ld_description": "", "detail_text": "", "detail_html": ""}
-            for selector in GUEST_DETAIL_SELECTORS:
-                element = await page.query_selector(selector)
-                if not element:
-                    continue
-                payload["detail_text"] = (await element.inner_text()).strip()
-                payload["detail_html"] = (await element.inner_html()).strip()
-                if payload["detail_text"] or payload["detail_html"]:
-                    break
-
+            payload = await fetch_guest_description(request, url)
             description = extract_job_description(payload)
             if not description or len(description) < 50:
                 logger.warning("No description found for %s (%s)", row["company"], row["title"])
@@ -95,14 +81,19 @@ async def backfill():
                 success + failed, len(rows), row["title"], row["company"], len(description),
             )
 
-            # Rate limit
-            await asyncio.sleep(1)
+            # Rate limit (jittered so requests do not land on a fixed cadence)
+            await asyncio.sleep(random.uniform(0.75, 1.25))
+
+        except LinkedInRateLimitError as exc:
+            logger.warning("%s; backing off", exc)
+            failed += 1
+            await asyncio.sleep(random.uniform(20, 40))
 
         except Exception as exc:
             logger.warning("Error fetching %s: %s", url, exc)
             failed += 1
 
-    await browser.close()
+    await request.dispose()
     await pw.stop()
 
     logger.info("Backfill complete: %d success, %d failed out of %d", success, failed, len(rows))
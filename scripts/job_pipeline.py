@@ -93,12 +93,15 @@ class JobPipeline:
         return {}
 
     def import_inbox(self) -> int:
-        """Import all JSON files from inbox"""
+        """Import all JSON / JSON Lines files from inbox"""
         if not INBOX_DIR.exists():
             INBOX_DIR.mkdir(parents=True, exist_ok=True)
             return 0
 
-        json_files = list(INBOX_DIR.glob("*.json"))
+        json_files = [
+            path for pattern in ("*.json", "*.jsonl", "*.ndjson")
+            for path in sorted(INBOX_DIR.glob(pattern))
+        ]
         if not json_files:
             print("[Import] inbox is empty")
             return 0
@@ -376,6 +379,7 @@ class JobPipeline:
     def cmd_prepare(self, min_ai_score: float = None, limit: int = None, since: str = None):
         """One-command: generate all materials + launch checklist server."""
         from src.checklist_server import generate_checklist, start_server
+        from src.pdf_renderer import preload_browser
         from src.resume_renderer import ResumeRenderer
 
         threshold = min_ai_score or self.ai_config.get('thresholds', {}).get(
@@ -423,6 +427,7 @@ class JobPipeline:
 
         if renderable_jobs:
             print(f"\nGenerating materials for {len(renderable_jobs)} jobs...")
+            preload_browser()
 
             for job in renderable_jobs:
                 job_id = job['id']
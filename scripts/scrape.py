@@ -3,13 +3,14 @@ Unified scraper CLI for Block A rebuild.
 """
 
 import argparse
-import json
 import logging
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
+import orjson
 import yaml
 
 PROJECT_ROOT = Path(__file__).parent.parent
@@ -23,6 +24,7 @@ METRICS_PATH = DATA_DIR / "scrape_metrics.json"
 PROFILES_PATH = CONFIG_DIR / "search_profiles.yaml"
 TARGET_COMPANIES_PATH = CONFIG_DIR / "target_companies.yaml"
 LEGACY_PROFILES = {"ml_data", "backend_data", "quick_test"}
+PLATFORM_CONCURRENCY = 3
 
 logging.basicConfig(
     level=logging.INFO,
@@ -137,31 +139,45 @@ def emit_metrics(platform_reports: dict[str, dict], output_path: Path | None = N
     }
     metrics_path = output_path or METRICS_PATH
     metrics_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(metrics_path, "w", encoding="utf-8") as f:
-        json.dump(metrics, f, indent=2)
+    metrics_path.write_bytes(orjson.dumps(metrics, option=orjson.OPT_INDENT_2))
     return metrics
 
 
-def run_platforms(platforms: list[str], profile: str | None, save_to_db: bool, dry_run: bool) -> dict:
-    platform_reports: dict[str, dict] = {}
-    for platform in platforms:
-        started_at = time.perf_counter()
-        scraper = build_scraper(platform, profile=profile)
-        report = scraper.run(dry_run=(dry_run or not save_to_db))
-        serialized_report = serialize_report(report)
-        platform_reports[platform] = serialized_report
-        elapsed = time.perf_counter() - started_at
-        diagnostics = serialized_report.setdefault("diagnostics", {})
-        diagnostics["elapsed_seconds"] = round(elapsed, 2)
-        logger.info(
-            "Platform %s completed in %.2fs severity=%s found=%d new=%d",
-            platform,
-            elapsed,
-            serialized_report.get("severity", "n/a"),
-            serialized_report.get("found", 0),
-            serialized_report.get("new", 0),
-        )
-    return platform_reports
+def run_platform(platform: str, scraper, save_to_db: bool, dry_run: bool) -> dict:
+    started_at = time.perf_counter()
+    report = scraper.run(dry_run=(dry_run or not save_to_db))
+    serialized_report = serialize_report(report)
+    elapsed = time.perf_counter() - started_at
+    diagnostics = serialized_report.setdefault("diagnostics", {})
+    diagnostics["elapsed_seconds"] = round(elapsed, 2)
+    logger.info(
+        "Platform %s completed in %.2fs severity=%s found=%d new=%d",
+        platform,
+        elapsed,
+        serialized_report.get("severity", "n/a"),
+        serialized_report.get("found", 0),
+        serialized_report.get("new", 0),
+    )
+    return serialized_report
+
+
+def run_platforms(
+    platforms: list[str],
+    profile: str | None,
+    save_to_db: bool,
+    dry_run: bool,
+    max_workers: int = PLATFORM_CONCURRENCY,
+) -> dict:
+    """Run platforms side by side; each scraper is network-bound and owns its browser/session."""
+    # Built here, one at a time: each scraper opens a JobDatabase, whose schema migrations
+    # must not race across pool threads.
+    scrapers = {platform: build_scraper(platform, profile=profile) for platform in platforms}
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(platforms) or 1))) as pool:
+        futures = {
+            platform: pool.submit(run_platform, platform, scraper, save_to_db, dry_run)
+            for platform, scraper in scrapers.items()
+        }
+    return {platform: future.result() for platform, future in futures.items()}
 
 
 def main(argv: list[str] | None = None) -> int:
@@ -182,7 +198,7 @@ def main(argv: list[str] | None = None) -> int:
         dry_run=args.dry_run,
     )
     metrics = emit_metrics(platform_reports)
-    print(json.dumps(metrics, indent=2))
+    print(orjson.dumps(metrics, option=orjson.OPT_INDENT_2).decode())
     severity = metrics["total"].get("severity", "info")
     logger.info(
         "Scrape summary: platforms=%s new=%d found=%d severity=%s",
@@ -31,6 +31,7 @@ except ImportError:
     pass
 
 from src import TRANSFERABLE_SKIP_WORDS
+from src.keyword_matcher import compile_keyword_matcher
 from src.db.job_db import JobDatabase, AnalysisResult, Resume
 from src.resume_validator import ResumeValidator
 from src.template_registry import (
@@ -40,6 +41,23 @@ from src.template_registry import (
 )
 
 
+# Title keyword -> role type for project-affinity routing. Role types are reported in
+# this order; a single lookahead scan finds every (possibly overlapping) keyword.
+ROLE_TYPE_KEYWORDS = {
+    'ml_engineer': ('machine learning', 'ml engineer', 'ml/', 'ml '),
+    'ai_engineer': ('ai engineer', 'artificial intelligence', 'ai/'),
+    'data_engineer': ('data engineer', 'analytics engineer'),
+    'data_scientist': ('data scientist', 'research scientist'),
+}
+_match_role_types = compile_keyword_matcher(ROLE_TYPE_KEYWORDS)
+
+
+def infer_role_types(job_title: str) -> List[str]:
+    """Role types whose keywords appear in the title, in ROLE_TYPE_KEYWORDS order."""
+    found = _match_role_types(job_title.lower())
+    return [role for role in ROLE_TYPE_KEYWORDS if role in found]
+
+
 class QuotaExhaustedError(Exception):
     """Raised when Claude Code CLI reports quota/rate limit exhaustion."""
     pass
@@ -225,17 +243,7 @@ class AIAnalyzer:
 
     def _build_project_affinity_note(self, job_title: str) -> str:
         """Generate a note highlighting which projects match the inferred role type."""
-        title_lower = job_title.lower()
-
-        role_types = []
-        if any(kw in title_lower for kw in ['machine learning', 'ml engineer', 'ml/', 'ml ']):
-            role_types.append('ml_engineer')
-        if any(kw in title_lower for kw in ['ai engineer', 'artificial intelligence', 'ai/']):
-            role_types.append('ai_engineer')
-        if 'data engineer' in title_lower or 'analytics engineer' in title_lower:
-            role_types.append('data_engineer')
-        if 'data scientist' in title_lower or 'research scientist' in title_lower:
-            role_types.append('data_scientist')
+        role_types = infer_role_types(job_title)
 
         if not role_types:
             return ''
@@ -265,17 +273,7 @@ class AIAnalyzer:
 
     def _reorder_projects_by_affinity(self, library_text: str, job_title: str) -> str:
         """Reorder PROJECTS section so role-affinity matches appear first."""
-        title_lower = job_title.lower()
-
-        role_types = []
-        if any(kw in title_lower for kw in ['machine learning', 'ml engineer', 'ml/', 'ml ']):
-            role_types.append('ml_engineer')
-        if any(kw in title_lower for kw in ['ai engineer', 'artificial intelligence', 'ai/']):
-            role_types.append('ai_engineer')
-        if 'data engineer' in title_lower or 'analytics engineer' in title_lower:
-            role_types.append('data_engineer')
-        if 'data scientist' in title_lower or 'research scientist' in title_lower:
-            role_types.append('data_scientist')
+        role_types = infer_role_types(job_title)
 
         if not role_types:
             return library_text
@@ -20,10 +20,28 @@ try:
 except ImportError:
     pass
 
+from src.keyword_matcher import compile_keyword_matcher
 from src.db.job_db import JobDatabase, CoverLetter
 from src.language_guidance import format_language_guidance_for_prompt
 
 
+# Title keyword -> role type for fragment filtering, matched with the same shared
+# compile_keyword_matcher as ai_analyzer.ROLE_TYPE_KEYWORDS.
+CL_ROLE_TYPE_KEYWORDS = {
+    'data_engineer': ('data engineer', 'etl', 'pipeline', 'databricks',
+                      'spark', 'data platform', 'data infrastructure'),
+    'ml_engineer': ('ml engineer', 'machine learning engineer',
+                    'ai engineer', 'deep learning'),
+    'data_scientist': ('data scientist', 'data science',
+                       'applied scientist'),
+    'quant': ('quant', 'trading', 'derivatives', 'risk analyst',
+              'portfolio', 'hedge fund'),
+    'data_analyst': ('data analyst', 'analytics', 'business intelligence',
+                     'bi developer'),
+}
+_match_cl_role_types = compile_keyword_matcher(CL_ROLE_TYPE_KEYWORDS)
+
+
 def _extract_application_brief_text(analysis: Dict) -> str:
     reasoning = analysis.get("reasoning", "")
     try:
@@ -132,24 +150,7 @@ class CoverLetterGenerator:
     def _infer_role_types(self, job: Dict, analysis: Dict) -> List[str]:
         """Infer role types from job title for fragment filtering"""
         title = (job.get('title', '') or '').lower()
-        role_types = set()
-
-        mapping = {
-            'data_engineer': ['data engineer', 'etl', 'pipeline', 'databricks',
-                              'spark', 'data platform', 'data infrastructure'],
-            'ml_engineer': ['ml engineer', 'machine learning engineer',
-                            'ai engineer', 'deep learning'],
-            'data_scientist': ['data scientist', 'data science',
-                               'applied scientist'],
-            'quant': ['quant', 'trading', 'derivatives', 'risk analyst',
-                      'portfolio', 'hedge fund'],
-            'data_analyst': ['data analyst', 'analytics', 'business intelligence',
-                             'bi developer'],
-        }
-
-        for role_type, keywords in mapping.items():
-            if any(kw in title for kw in keywords):
-                role_types.add(role_type)
+        role_types = _match_cl_role_types(title)
 
         # Fallback: if no specific match, use broad types
         if not role_types:
@@ -27,6 +27,14 @@ PROJECT_ROOT = Path(__file__).parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
 from src.db.job_db import JobDatabase, CoverLetter
+from src.pdf_renderer import html_to_pdf, preload_browser
+
+# ASCII fast path for _safe_filename: drop every non-word character except whitespace and '-'
+_FILENAME_TRANSLATION = str.maketrans({
+    chr(c): None for c in range(128) if not (chr(c).isalnum() or chr(c).isspace() or chr(c) in '_-')
+})
+_UNSAFE_FILENAME_RE = re.compile(r'[^\w\s-]')
+_WHITESPACE_RUN_RE = re.compile(r'\s+')
 
 
 class CoverLetterRenderer:
@@ -66,8 +74,11 @@ class CoverLetterRenderer:
     @staticmethod
     def _safe_filename(text: str) -> str:
         """Convert text to safe filename"""
-        safe = re.sub(r'[^\w\s-]', '', text).strip()
-        safe = re.sub(r'[\s]+', '_', safe)
+        if text.isascii():
+            safe = text.translate(_FILENAME_TRANSLATION).strip()
+        else:
+            safe = _UNSAFE_FILENAME_RE.sub('', text).strip()
+        safe = _WHITESPACE_RUN_RE.sub('_', safe)
         return safe
 
     def render(self, job_id: str) -> Optional[Dict[str, str]]:
@@ -199,30 +210,24 @@ class CoverLetterRenderer:
     def _html_to_pdf(self, html_path: Path, pdf_path: Path) -> bool:
         """Convert HTML to PDF via Playwright"""
         try:
-            from playwright.sync_api import sync_playwright
+            import playwright.sync_api  # noqa: F401
         except ImportError:
             print("  [WARN] Playwright not installed. PDF generation skipped.")
             return False
 
         try:
-            with sync_playwright() as p:
-                browser = p.chromium.launch()
-                try:
-                    page = browser.new_page()
-                    page.goto(html_path.absolute().as_uri())
-                    page.pdf(
-                        path=str(pdf_path),
-                        format='A4',
-                        margin={
-                            'top': '0.75in',
-                            'right': '0.75in',
-                            'bottom': '0.75in',
-                            'left': '0.75in',
-                        },
-                        print_background=True
-                    )
-                finally:
-                    browser.close()
+            html_to_pdf(
+                html_path,
+                pdf_path,
+                format='A4',
+                margin={
+                    'top': '0.75in',
+                    'right': '0.75in',
+                    'bottom': '0.75in',
+                    'left': '0.75in',
+                },
+                print_background=True
+            )
             return True
 
         except Exception as e:
@@ -259,6 +264,7 @@ class CoverLetterRenderer:
             return 0
 
         print(f"\n[CLRenderer] Rendering {len(jobs_with_cl)} cover letters...")
+        preload_browser()
         rendered = 0
 
         for i, job in enumerate(jobs_with_cl):
@@ -14,9 +14,9 @@ SQLite 数据库操作，统一管理职位数据的存储和查询。
 """
 
 import hashlib
-import json
 import logging
 import os
+import re
 import sqlite3
 import time
 from contextlib import contextmanager
@@ -25,6 +25,7 @@ from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import List, Dict, Optional, Any, Generator
 
+import orjson
 import yaml
 
 # Load .env if available (for local dev — CI uses env: blocks)
@@ -36,6 +37,10 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+NDJSON_SUFFIXES = {".jsonl", ".ndjson"}
+# Word tokens for _normalize_title; runs once per candidate row in semantic dedup
+_TITLE_WORD_RE = re.compile(r'[a-z0-9+#]+')
+
 # 数据库路径
 DB_PATH = Path(__file__).parent.parent.parent / "data" / "jobs.db"
 CONFIG_DIR = Path(__file__).parent.parent.parent / "config"
@@ -215,7 +220,7 @@ class TursoHTTPClient:
             except (httpx.ConnectError, httpx.TimeoutException) as e:
                 if attempt < 2:
                     wait = 2 ** attempt
-                    print(f"  [WARN] Turso HTTP retry {attempt+1}/3 after {wait}s: {e}")
+                    logger.warning("Turso HTTP retry %d/3 after %ds: %s", attempt + 1, wait, e)
                     time.sleep(wait)
                 else:
                     raise
@@ -353,6 +358,9 @@ class _TursoConnAdapter:
 class JobDatabase:
     """职位数据库操作类"""
 
+    # Set by _shared_connection() while a batch reuses one SQLite connection
+    _shared_conn: Optional[sqlite3.Connection] = None
+
     # 数据库 Schema
     SCHEMA = """
     -- 职位主表
@@ -533,6 +541,8 @@ class JobDatabase:
 
     -- 索引
     CREATE INDEX IF NOT EXISTS idx_jobs_company ON jobs(company);
+    -- 语义去重按 LOWER(company) 查找, 表达式索引避免每次插入全表扫描
+    CREATE INDEX IF NOT EXISTS idx_jobs_company_lower ON jobs(LOWER(company));
     CREATE INDEX IF NOT EXISTS idx_jobs_source ON jobs(source);
     CREATE INDEX IF NOT EXISTS idx_jobs_scraped_at ON jobs(scraped_at);
     CREATE INDEX IF NOT EXISTS idx_jobs_search_profile ON jobs(search_profile);
@@ -739,7 +749,7 @@ CREATE INDEX IF NOT EXISTS idx_applications_status ON applications(status);
         """Add columns introduced after initial schema."""
         resume_columns = {row[1] for row in conn.execute("PRAGMA table_info(resumes)").fetchall()}
         if 'submit_dir' not in resume_columns:
-            conn.execute("ALTER TABLE resumes ADD COLUMN submit_dir TEXT")
+            self._add_column(conn, "ALTER TABLE resumes ADD COLUMN submit_dir TEXT")
 
         analysis_columns = {row[1] for row in conn.execute("PRAGMA table_info(job_analysis)").fetchall()}
         analysis_migrations = {
@@ -756,20 +766,29 @@ CREATE INDEX IF NOT EXISTS idx_applications_status ON applications(status);
         }
         for column, sql in analysis_migrations.items():
             if column not in analysis_columns:
-                conn.execute(sql)
+                self._add_column(conn, sql)
 
         # F4: manual_source for jobs table
         jobs_columns = {row[1] for row in conn.execute("PRAGMA table_info(jobs)").fetchall()}
         if jobs_columns and 'manual_source' not in jobs_columns:
-            conn.execute("ALTER TABLE jobs ADD COLUMN manual_source TEXT")
+            self._add_column(conn, "ALTER TABLE jobs ADD COLUMN manual_source TEXT")
 
         # F10: rejection tracking for applications table
         app_columns = {row[1] for row in conn.execute("PRAGMA table_info(applications)").fetchall()}
         if app_columns:
             if 'rejection_reason' not in app_columns:
-                conn.execute("ALTER TABLE applications ADD COLUMN rejection_reason TEXT")
+                self._add_column(conn, "ALTER TABLE applications ADD COLUMN rejection_reason TEXT")
             if 'rejection_stage' not in app_columns:
-                conn.execute("ALTER TABLE applications ADD COLUMN rejection_stage TEXT")
+                self._add_column(conn, "ALTER TABLE applications ADD COLUMN rejection_stage TEXT")
+
+    @staticmethod
+    def _add_column(conn, sql: str) -> None:
+        """Run an ADD COLUMN migration, tolerating a concurrent initializer that added it first."""
+        try:
+            conn.execute(sql)
+        except sqlite3.OperationalError as e:
+            if "duplicate column name" not in str(e):
+                raise
 
     @contextmanager
     def _get_conn(self, *, sync_before=True):
@@ -781,11 +800,15 @@ CREATE INDEX IF NOT EXISTS idx_applications_status ON applications(status);
         """
         if self._turso_http:
             yield _TursoConnAdapter(self._turso_http)
+        elif self._shared_conn is not None:
+            yield self._shared_conn
         else:
             conn = sqlite3.connect(str(self.db_path))
             conn.row_factory = sqlite3.Row
             try:
                 conn.execute("PRAGMA journal_mode=WAL")
+                # WAL stays consistent at NORMAL; only the last commits before a power loss can roll back
+                conn.execute("PRAGMA synchronous=NORMAL")
                 conn.execute("PRAGMA busy_timeout=5000")
                 conn.execute("PRAGMA foreign_keys=ON")
                 yield conn
@@ -808,6 +831,21 @@ CREATE INDEX IF NOT EXISTS idx_applications_status ON applications(status);
         """
         yield
 
+    @contextmanager
+    def _shared_connection(self):
+        """Route every _get_conn inside the block through one connection, so
+        the statements share a single SQLite transaction committed on exit.
+        """
+        if self._turso_http or self._shared_conn is not None:
+            yield
+            return
+        with self._get_conn() as conn:
+            self._shared_conn = conn
+            try:
+                yield
+            finally:
+                self._shared_conn = None
+
     def final_sync(self):
         """No-op — HTTP transport is always live."""
         pass
@@ -833,6 +871,15 @@ CREATE INDEX IF NOT EXISTS idx_applications_status ON applications(status);
         clean_url = url.split('?')[0].split('#')[0].rstrip('/')
         return hashlib.md5(clean_url.encode()).hexdigest()[:12]
 
+    def insert_jobs(self, jobs: List[Dict], dedup_window_days: int = 0) -> List[tuple]:
+        """Insert a batch of scraped jobs in one transaction.
+
+        Same per-job semantics as insert_job; returns its (job_id, was_inserted)
+        tuples in order.
+        """
+        with self._shared_connection():
+            return [self.insert_job(job, dedup_window_days=dedup_window_days) for job in jobs]
+
     def job_exists(self, url: str) -> bool:
         """检查职位是否已存在"""
         job_id = self.generate_job_id(url)
@@ -959,7 +1006,7 @@ CREATE INDEX IF NOT EXISTS idx_applications_status ON applications(status);
         title = job_data.get("title", "")
         company = job_data.get("company", "")
         if not title.strip() or not company.strip():
-            print(f"  [WARN] Skipping job with empty title or company: {url[:60]}")
+            logger.warning("Skipping job with empty title or company: %s", url[:60])
             return job_id, False
 
         # Semantic dedup: same company + normalized title = same job from different source
@@ -1463,8 +1510,7 @@ CREATE INDEX IF NOT EXISTS idx_applications_status ON applications(status);
     @staticmethod
     def _normalize_title(title: str) -> str:
         """标准化职位标题为排序词集合，忽略词序和标点"""
-        import re
-        words = re.findall(r'[a-z0-9+#]+', title.lower())
+        words = _TITLE_WORD_RE.findall(title.lower())
         return ' '.join(sorted(words))
 
     def find_applied_duplicates(self, job_id: str) -> List[Dict]:
@@ -1782,11 +1828,16 @@ CREATE INDEX IF NOT EXISTS idx_applications_status ON applications(status);
     # ==================== 批量操作 ====================
 
     def import_from_json(self, json_path: Path, profile: str = "", query: str = "") -> int:
-        """从 JSON 文件导入职位 (single connection for entire batch)"""
-        with open(json_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        """从 JSON 文件导入职位 (single connection for entire batch)
 
-        if isinstance(data, list):
+        ``.jsonl`` / ``.ndjson`` 文件逐行解析，不会把整个文件读入内存。
+        """
+        if Path(json_path).suffix in NDJSON_SUFFIXES:
+            data = self._iter_ndjson(Path(json_path))
+        else:
+            data = orjson.loads(Path(json_path).read_bytes())
+
+        if not isinstance(data, dict):
             jobs = data
             meta_profile = ""
             meta_search = ""
@@ -1845,33 +1896,67 @@ CREATE INDEX IF NOT EXISTS idx_applications_status ON applications(status);
                         isinstance(e, sqlite3.IntegrityError)
                         or "UNIQUE constraint" in str(e)
                     )
-                    severity = "WARN" if is_constraint else "ERROR"
-                    print(f"  [{severity}] Failed to import job {url[:60]}: {e}")
+                    level = logging.WARNING if is_constraint else logging.ERROR
+                    logger.log(level, "Failed to import job %s: %s", url[:60], e)
 
         return imported
 
-    def export_to_json(self, output_path: Path, **filters) -> int:
-        """导出职位到 JSON"""
-        with self._get_conn() as conn:
-            query = "SELECT * FROM jobs WHERE 1=1"
-            params = []
+    @staticmethod
+    def _iter_ndjson(path: Path):
+        with open(path, "rb") as f:
+            for line in f:
+                if line.strip():
+                    yield orjson.loads(line)
 
-            if filters.get("profile"):
-                query += " AND search_profile = ?"
-                params.append(filters["profile"])
+    def export_to_json(self, output_path: Path, **filters) -> int:
+        """导出职位到 JSON
 
-            if filters.get("min_score"):
-                query += " AND id IN (SELECT job_id FROM job_analysis WHERE ai_score >= ?)"
-                params.append(filters["min_score"])
+        ``.jsonl`` / ``.ndjson`` 路径按行流式写出（每行一个职位），内存占用不随行数增长。
+        """
+        if Path(output_path).suffix in NDJSON_SUFFIXES:
+            return self._export_to_ndjson(Path(output_path), **filters)
 
+        with self._get_conn() as conn:
+            query, params = self._export_query(**filters)
             cursor = conn.execute(query, params)
             jobs = [dict(row) for row in cursor.fetchall()]
 
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump({"jobs": jobs, "exported_at": datetime.now().isoformat()}, f, indent=2, ensure_ascii=False)
+        payload = {"jobs": jobs, "exported_at": datetime.now().isoformat()}
+        Path(output_path).write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
 
         return len(jobs)
 
+    @staticmethod
+    def _export_query(**filters) -> tuple[str, list]:
+        query = "SELECT * FROM jobs WHERE 1=1"
+        params = []
+
+        if filters.get("profile"):
+            query += " AND search_profile = ?"
+            params.append(filters["profile"])
+
+        if filters.get("min_score"):
+            query += " AND id IN (SELECT job_id FROM job_analysis WHERE ai_score >= ?)"
+            params.append(filters["min_score"])
+
+        return query, params
+
+    def _export_to_ndjson(self, output_path: Path, **filters) -> int:
+        """逐行写出 NDJSON：游标迭代 + 临时文件替换，中途失败不会留下半截文件"""
+        query, params = self._export_query(**filters)
+        tmp_path = output_path.with_name(output_path.name + ".tmp")
+        count = 0
+        try:
+            with self._get_conn() as conn, open(tmp_path, "wb") as f:
+                for row in conn.execute(query, params):
+                    f.write(orjson.dumps(dict(row), option=orjson.OPT_APPEND_NEWLINE))
+                    count += 1
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+        os.replace(tmp_path, output_path)
+        return count
+
 
 # ==================== CLI 接口 ====================
 
@@ -0,0 +1,31 @@
+"""
+Keyword -> category matching shared by ai_analyzer and cover_letter_generator.
+"""
+
+import re
+from typing import Callable, Dict, Iterable, Set
+
+
+def compile_keyword_matcher(keywords_by_category: Dict[str, Iterable[str]]) -> Callable[[str], Set[str]]:
+    """Return ``match(text)`` -> set of categories with a keyword occurring in ``text``.
+
+    One lookahead alternation scans the text once, so keywords starting at different
+    positions are all found even when they overlap. At a single position only one
+    alternative can match, so a keyword that is a prefix of (or equal to) a keyword in
+    another category would hide one of them: such tables are rejected here.
+    """
+    category_by_keyword: Dict[str, str] = {}
+    for category, keywords in keywords_by_category.items():
+        for kw in keywords:
+            category_by_keyword.setdefault(kw, category)
+            for other, other_category in category_by_keyword.items():
+                if other_category != category and (other.startswith(kw) or kw.startswith(other)):
+                    raise ValueError(
+                        f"Keyword {kw!r} ({category}) collides with {other!r} ({other_category})"
+                    )
+    pattern = re.compile('(?=(' + '|'.join(re.escape(kw) for kw in category_by_keyword) + '))')
+
+    def match(text: str) -> Set[str]:
+        return {category_by_keyword[m.group(1)] for m in pattern.finditer(text)}
+
+    return match
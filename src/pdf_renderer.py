@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+PDF Renderer - HTML 转 PDF
+==========================
+
+简历和求职信共用的 Playwright 打印逻辑。
+
+Chromium 在第一次调用时懒启动，之后整个进程复用同一个浏览器，
+退出时由 atexit 关闭。批量渲染（两个 render_batch 和 cmd_prepare）开始前
+会调用 preload_browser() 预热。
+
+同步版 Playwright 会把自己的事件循环登记为所在线程的 running loop，
+所以它只在一个专用的后台线程里运行：调用方线程之后仍然可以 asyncio.run()。
+"""
+
+import atexit
+import queue
+import threading
+from concurrent.futures import Future
+from pathlib import Path
+
+# Process-wide Chromium, started lazily on the renderer thread
+_playwright = None
+_browser = None
+# Every Playwright call runs on this daemon thread; callers block on a Future
+_worker = None
+_worker_lock = threading.Lock()
+_tasks: "queue.Queue" = queue.Queue()
+
+
+def _serve() -> None:
+    while True:
+        future, fn, args = _tasks.get()
+        if not future.set_running_or_notify_cancel():
+            continue
+        try:
+            future.set_result(fn(*args))
+        except BaseException as exc:
+            future.set_exception(exc)
+
+
+def _run_on_worker(fn, *args):
+    """Run ``fn`` on the renderer thread and return its result (exceptions propagate)."""
+    global _worker
+    if threading.current_thread() is _worker:
+        return fn(*args)
+    with _worker_lock:
+        if _worker is None or not _worker.is_alive():
+            _worker = threading.Thread(target=_serve, name="pdf-renderer", daemon=True)
+            _worker.start()
+    future = Future()
+    _tasks.put((future, fn, args))
+    return future.result()
+
+
+def _start_browser():
+    global _playwright, _browser
+    if _browser is not None and _browser.is_connected():
+        return _browser
+    _stop_browser()
+
+    from playwright.sync_api import sync_playwright
+
+    playwright = sync_playwright().start()
+    try:
+        browser = playwright.chromium.launch()
+    except Exception:
+        playwright.stop()
+        raise
+    _playwright, _browser = playwright, browser
+    return browser
+
+
+def _stop_browser() -> None:
+    global _playwright, _browser
+    browser, playwright = _browser, _playwright
+    _playwright = _browser = None
+    if browser is not None:
+        try:
+            browser.close()
+        except Exception:
+            pass
+    if playwright is not None:
+        try:
+            playwright.stop()
+        except Exception:
+            pass
+
+
+def preload_browser() -> None:
+    """Warm the shared Chromium ahead of a batch.
+
+    Best effort: a launch failure is left for the first html_to_pdf() to report per job.
+    """
+    try:
+        _run_on_worker(_start_browser)
+    except Exception:
+        pass
+
+
+def shutdown_browser() -> None:
+    """Close the shared Chromium; the next render starts a fresh one."""
+    if _browser is None and _playwright is None:
+        return
+    _run_on_worker(_stop_browser)
+
+
+atexit.register(shutdown_browser)
+
+
+def html_to_pdf(html_path: Path, pdf_path: Path, *, timeout: int = 30000, **pdf_options) -> None:
+    """Print a local HTML file to ``pdf_path``. Playwright errors propagate to the caller."""
+    _run_on_worker(_render, html_path, pdf_path, timeout, pdf_options)
+
+
+def _render(html_path: Path, pdf_path: Path, timeout: int, pdf_options: dict) -> None:
+    page = _start_browser().new_page()
+    try:
+        # "load" covers the template's stylesheets; fonts.ready then resolves once the webfonts
+        # are in, instead of sitting out a networkidle window on a static file.
+        page.goto(html_path.absolute().as_uri(), wait_until="load", timeout=timeout)
+        page.evaluate("() => document.fonts.ready.then(() => true)")
+        page.pdf(path=str(pdf_path), **pdf_options)
+    finally:
+        page.close()
@@ -26,9 +26,17 @@ PROJECT_ROOT = Path(__file__).parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
 from src.db.job_db import JobDatabase, Resume
+from src.pdf_renderer import html_to_pdf, preload_browser
 from src.resume_validator import ResumeValidator
 from src.template_registry import load_registry
 
+# ASCII fast path for _safe_filename: every non-word character except '-' maps to '_'
+_FILENAME_TRANSLATION = str.maketrans({
+    chr(c): '_' for c in range(128) if not (chr(c).isalnum() or chr(c) in '_-')
+})
+_UNSAFE_FILENAME_RE = re.compile(r'[^\w\-]')
+_UNDERSCORE_RUN_RE = re.compile(r'_+')
+
 
 class ResumeRenderer:
     """简历渲染器"""
@@ -460,10 +468,13 @@ class ResumeRenderer:
 
     def _safe_filename(self, name: str) -> str:
         """将字符串转换为安全的文件名"""
-        # Remove special characters
-        safe = re.sub(r'[^\w\-]', '_', name)
+        # Remove special characters (translate table for ASCII, regex for Unicode names)
+        if name.isascii():
+            safe = name.translate(_FILENAME_TRANSLATION)
+        else:
+            safe = _UNSAFE_FILENAME_RE.sub('_', name)
         # Remove consecutive underscores
-        safe = re.sub(r'_+', '_', safe)
+        safe = _UNDERSCORE_RUN_RE.sub('_', safe)
         # Remove leading/trailing underscores
         safe = safe.strip('_')
         return safe or 'unknown'
@@ -471,7 +482,7 @@ class ResumeRenderer:
     def _html_to_pdf(self, html_path: Path, pdf_path: Path, margin_override: Dict = None) -> bool:
         """使用 Playwright 将 HTML 转换为 PDF."""
         try:
-            from playwright.sync_api import sync_playwright
+            import playwright.sync_api  # noqa: F401
         except ImportError:
             print("  [WARN] Playwright not installed. PDF generation skipped.")
             print("  Run: pip install playwright && playwright install chromium")
@@ -491,23 +502,14 @@ class ResumeRenderer:
                     'left': margin.get('left', '0.55in'),
                 }
 
-            with sync_playwright() as p:
-                browser = p.chromium.launch()
-                try:
-                    page = browser.new_page()
-
-                    # Load HTML file
-                    page.goto(html_path.absolute().as_uri(), timeout=15000)
-
-                    # Generate PDF
-                    page.pdf(
-                        path=str(pdf_path),
-                        format=pdf_config.get('format', 'A4'),
-                        margin=pdf_margin,
-                        print_background=pdf_config.get('print_background', True),
-                    )
-                finally:
-                    browser.close()
+            html_to_pdf(
+                html_path,
+                pdf_path,
+                timeout=15000,
+                format=pdf_config.get('format', 'A4'),
+                margin=pdf_margin,
+                print_background=pdf_config.get('print_background', True),
+            )
 
             return True
 
@@ -531,6 +533,7 @@ class ResumeRenderer:
             return 0
 
         print(f"\n[Renderer] Generating resumes for {len(jobs)} jobs...")
+        preload_browser()
         rendered = 0
 
         for i, job in enumerate(jobs):
@@ -14,6 +14,8 @@ from typing import Dict
 import fitz
 from PIL import Image, ImageChops, ImageStat
 
+from src.pdf_renderer import html_to_pdf
+
 
 @dataclass(frozen=True)
 class ArtifactPaths:
@@ -41,23 +43,16 @@ def build_artifact_paths(reference_pdf: Path, candidate_html: Path, output_dir:
 
 def render_html_to_pdf(html_path: Path, pdf_path: Path) -> None:
     """Render a local HTML file to a single-page A4 PDF via Playwright."""
-    from playwright.sync_api import sync_playwright
-
-    with sync_playwright() as playwright:
-        browser = playwright.chromium.launch()
-        try:
-            page = browser.new_page()
-            page.goto(html_path.resolve().as_uri(), wait_until="networkidle", timeout=15000)
-            page.pdf(
-                path=str(pdf_path),
-                format="A4",
-                margin={"top": "0", "right": "0", "bottom": "0", "left": "0"},
-                print_background=True,
-                prefer_css_page_size=True,
-                page_ranges="1",
-            )
-        finally:
-            browser.close()
+    html_to_pdf(
+        html_path.resolve(),
+        pdf_path,
+        timeout=15000,
+        format="A4",
+        margin={"top": "0", "right": "0", "bottom": "0", "left": "0"},
+        print_background=True,
+        prefer_css_page_size=True,
+        page_ranges="1",
+    )
 
 
 def rasterize_pdf_to_png(pdf_path: Path, png_path: Path, dpi: int) -> None:
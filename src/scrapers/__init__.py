@@ -1,12 +1,22 @@
-from src.scrapers.base import BaseScraper, ScrapeReport
-from src.scrapers.greenhouse import GreenhouseScraper
-from src.scrapers.iamexpat import IamExpatScraper
-from src.scrapers.linkedin import LinkedInScraper
-
-__all__ = [
-    "BaseScraper",
-    "ScrapeReport",
-    "GreenhouseScraper",
-    "IamExpatScraper",
-    "LinkedInScraper",
-]
+import importlib
+
+# Resolved on first attribute access (PEP 562): importing a submodule such as
+# src.scrapers.registry no longer pulls in Playwright, requests and the DB layer.
+_EXPORTS = {
+    "BaseScraper": "src.scrapers.base",
+    "ScrapeReport": "src.scrapers.base",
+    "GreenhouseScraper": "src.scrapers.greenhouse",
+    "IamExpatScraper": "src.scrapers.iamexpat",
+    "LinkedInScraper": "src.scrapers.linkedin",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    module_path = _EXPORTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_path), name)
+    globals()[name] = value
+    return value
@@ -1,4 +1,5 @@
 import logging
+import re
 import sys
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
@@ -28,6 +29,14 @@ def load_blacklists(config_path: Path = PROFILES_FILE) -> dict:
     }
 
 
+def compile_blacklist(terms: List[str]) -> re.Pattern | None:
+    """Fold substring blacklist terms into one alternation so each check is a single scan."""
+    terms = [term for term in terms if term]
+    if not terms:
+        return None
+    return re.compile("|".join(re.escape(term) for term in terms))
+
+
 @dataclass
 class ScrapeReport:
     source: str
@@ -82,6 +91,9 @@ class BaseScraper(ABC):
     def __init__(self):
         self.db = JobDatabase()
         self.blacklists = load_blacklists()
+        self._blacklist_patterns = {
+            field_name: compile_blacklist(terms) for field_name, terms in self.blacklists.items()
+        }
         self._target_errors: List[Dict[str, str]] = []
         self._run_errors: List[str] = []
         self._target_counts = {"attempted": 0, "succeeded": 0, "failed": 0}
@@ -102,13 +114,9 @@ class BaseScraper(ABC):
 
     def is_blacklisted(self, job: Dict) -> bool:
         """Check if job matches company or title blacklist."""
-        company = job.get("company", "").lower()
-        title = job.get("title", "").lower()
-        for bl in self.blacklists["company"]:
-            if bl in company:
-                return True
-        for bl in self.blacklists["title"]:
-            if bl in title:
+        for field_name in ("company", "title"):
+            pattern = self._blacklist_patterns.get(field_name)
+            if pattern and pattern.search(job.get(field_name, "").lower()):
                 return True
         return False
 
@@ -203,9 +211,7 @@ class BaseScraper(ABC):
             return report
 
         if jobs_to_insert:
-            with self.db.batch_mode():
-                for job in jobs_to_insert:
-                    self.db.insert_job(job, dedup_window_days=self.dedup_window_days)
+            self.db.insert_jobs(jobs_to_insert, dedup_window_days=self.dedup_window_days)
             report.new = len(jobs_to_insert)
 
         logger.info(
@@ -1,9 +1,11 @@
 import logging
 import random
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import List, Dict, Optional
 
+import orjson
 import requests
 
 from src.scrapers.base import BaseScraper
@@ -12,6 +14,7 @@ from src.scrapers.utils import strip_html
 logger = logging.getLogger(__name__)
 
 API_BASE = "https://boards-api.greenhouse.io/v1/boards"
+BOARD_CONCURRENCY = 4
 
 
 class GreenhouseScraper(BaseScraper):
@@ -20,19 +23,25 @@ class GreenhouseScraper(BaseScraper):
     def __init__(self, companies: List[Dict]):
         super().__init__()
         self.companies = companies
+        # One keep-alive pool for every board: all requests go to the same API host.
+        self.session = requests.Session()
 
     def _fetch_jobs(self, board_token: str) -> List[Dict]:
         """Fetch all jobs from a Greenhouse board."""
         url = f"{API_BASE}/{board_token}/jobs?content=true"
         for attempt in range(3):
             try:
-                resp = requests.get(url, timeout=30)
+                resp = self.session.get(url, timeout=30)
+                if resp.status_code == 429 and attempt < 2:
+                    time.sleep(self._retry_after(resp, attempt))
+                    continue
                 if 400 <= resp.status_code < 500:
                     raise requests.HTTPError(
                         f"HTTP {resp.status_code} for {url}", response=resp
                     )
                 resp.raise_for_status()
-                data = resp.json()
+                # content=true boards run to several MB; orjson decodes the raw bytes directly.
+                data = orjson.loads(resp.content)
                 return data.get("jobs", [])
             except (requests.ConnectionError, requests.Timeout) as e:
                 if attempt < 2:
@@ -45,13 +54,21 @@ class GreenhouseScraper(BaseScraper):
                 else:
                     raise
 
+    @staticmethod
+    def _retry_after(resp, attempt: int) -> float:
+        """Honour a numeric Retry-After header, else back off exponentially with jitter."""
+        header = resp.headers.get("Retry-After", "")
+        if header.isdigit():
+            return min(float(header), 60.0)
+        return 2 ** (attempt + 1) + random.random()
+
     def _matches_location(self, job: Dict, location_filter: Optional[str]) -> bool:
         if not location_filter:
             return True
         loc = job.get("location", {}).get("name", "")
         return location_filter.lower() in loc.lower()
 
-    def _to_job_dict(self, raw: Dict, company_name: str) -> Dict:
+    def _to_job_dict(self, raw: Dict, company_name: str, scraped_at: str | None = None) -> Dict:
         return {
             "title": raw.get("title", ""),
             "company": company_name,
@@ -59,36 +76,50 @@ class GreenhouseScraper(BaseScraper):
             "url": raw.get("absolute_url", ""),
             "description": strip_html(raw.get("content", "")),
             "source": "Greenhouse",
-            "scraped_at": datetime.now().isoformat(),
+            "scraped_at": scraped_at or datetime.now().isoformat(),
             "posted_date": raw.get("updated_at", ""),
             "search_profile": "ats",
             "search_query": f"greenhouse:{company_name}",
         }
 
+    def _fetch_board(self, board_token: str) -> List[Dict]:
+        raw_jobs = self._fetch_jobs(board_token)
+        # Per-worker pacing so concurrent boards still trickle in rather than burst.
+        time.sleep(random.uniform(0.5, 1.0))
+        return raw_jobs
+
     def scrape(self) -> List[Dict]:
         all_jobs = []
+        scraped_at = datetime.now().isoformat()  # One timestamp for the whole batch
+        boards = []
         for company in self.companies:
             if company.get("ats") != "greenhouse":
                 continue
-            token = company.get("board_token")
-            name = company.get("name")
-            if not token:
+            if not company.get("board_token"):
                 logger.warning("[Greenhouse] Skipping company config without board_token: %s", company)
                 continue
-            loc_filter = company.get("location_filter")
-            try:
-                raw_jobs = self._fetch_jobs(token)
-                matched = 0
-                for raw in raw_jobs:
-                    if self._matches_location(raw, loc_filter):
-                        all_jobs.append(self._to_job_dict(raw, name))
-                        matched += 1
-                self.record_target_success(name)
-                logger.info("[Greenhouse] %s: %d jobs (filtered from %d)", name, matched, len(raw_jobs))
-            except Exception as e:
-                self.record_target_failure(name, e)
-                logger.error("[Greenhouse] %s failed: %s", name, e)
+            boards.append(company)
+        if not boards:
+            return all_jobs
 
-            time.sleep(0.5 + random.random() * 0.5)
+        # Boards are independent HTTP fetches on one keep-alive session: overlap the waits,
+        # then fold results back in config order.
+        with ThreadPoolExecutor(max_workers=min(BOARD_CONCURRENCY, len(boards))) as pool:
+            futures = [pool.submit(self._fetch_board, company["board_token"]) for company in boards]
+            for company, future in zip(boards, futures):
+                name = company.get("name")
+                loc_filter = company.get("location_filter")
+                try:
+                    raw_jobs = future.result()
+                    matched = 0
+                    for raw in raw_jobs:
+                        if self._matches_location(raw, loc_filter):
+                            all_jobs.append(self._to_job_dict(raw, name, scraped_at))
+                            matched += 1
+                    self.record_target_success(name)
+                    logger.info("[Greenhouse] %s: %d jobs (filtered from %d)", name, matched, len(raw_jobs))
+                except Exception as e:
+                    self.record_target_failure(name, e)
+                    logger.error("[Greenhouse] %s failed: %s", name, e)
 
         return all_jobs
@@ -1,5 +1,4 @@
 import asyncio
-import json
 import logging
 import re
 from datetime import datetime
@@ -8,27 +7,51 @@ from typing import List, Dict
 from playwright.async_api import async_playwright
 
 from src.scrapers.base import BaseScraper
-from src.scrapers.utils import run_async
+from src.scrapers.utils import install_resource_blocking, run_async
 
 logger = logging.getLogger(__name__)
 
 BASE_URL = "https://www.iamexpat.nl/career/jobs-netherlands"
 CATEGORY_PATH = "it-technology-positions"
 JOBS_PER_PAGE = 20
+LISTING_CARD_SELECTOR = "a[href*='/career/jobs-netherlands/']"
+# href + rendered text for every card in one round-trip.
+LISTING_CARDS_SCRIPT = """
+(links) => links.map((link) => ({ href: link.getAttribute('href') || '', text: link.innerText || '' }))
+"""
+DETAIL_READY_SELECTOR = 'script[type="application/ld+json"], article, .job-description, main'
+# JSON-LD description, else the main content block, else the page body - one round-trip.
+DETAIL_CONTENT_SCRIPT = """
+() => {
+    const ld = document.querySelector('script[type="application/ld+json"]');
+    if (ld) {
+        try {
+            const description = JSON.parse(ld.textContent || '').description;
+            if (description) {
+                return description;
+            }
+        } catch (error) {}
+    }
+    const content = document.querySelector('article, .job-description, main') || document.body;
+    return content ? content.innerText || '' : '';
+}
+"""
 
 
 class IamExpatScraper(BaseScraper):
     source_name = "IamExpat"
 
-    def __init__(self, queries: List[Dict], headless: bool = True, max_pages: int = 5, detail_concurrency: int = 4):
+    def __init__(self, queries: List[Dict], headless: bool = True, max_pages: int = 5,
+                 detail_concurrency: int = 4, query_concurrency: int = 2):
         super().__init__()
         self.queries = queries
         self.headless = headless
         self.max_pages = max_pages
         self.detail_concurrency = max(1, detail_concurrency)
+        self.query_concurrency = max(1, query_concurrency)
 
     def _to_job_dict(self, title: str, company: str, location: str,
-                     url: str, description: str, query: str) -> Dict:
+                     url: str, description: str, query: str, scraped_at: str | None = None) -> Dict:
         return {
             "title": title,
             "company": company,
@@ -36,7 +59,7 @@ class IamExpatScraper(BaseScraper):
             "url": url,
             "description": description,
             "source": "IamExpat",
-            "scraped_at": datetime.now().isoformat(),
+            "scraped_at": scraped_at or datetime.now().isoformat(),
             "search_profile": "iamexpat",
             "search_query": query,
         }
@@ -48,17 +71,17 @@ class IamExpatScraper(BaseScraper):
         except Exception as exc:
             logger.warning("[IamExpat] Navigation failed for %s: %s", url[:80], exc)
             return None
-        await page.wait_for_timeout(1000)  # Let Next.js hydrate
         try:
-            await page.wait_for_selector("a[href*='/career/jobs-netherlands/']", timeout=4000)
+            # Cards appear once Next.js hydrates; waiting on them replaces a fixed sleep.
+            await page.wait_for_selector(LISTING_CARD_SELECTOR, state="attached", timeout=5000)
         except Exception:
             return []
 
-        cards = await page.query_selector_all("a[href*='/career/jobs-netherlands/']")
+        cards = await page.locator(LISTING_CARD_SELECTOR).evaluate_all(LISTING_CARDS_SCRIPT)
         results = []
         seen_urls = set()
         for card in cards:
-            href = await card.get_attribute("href")
+            href = card["href"]
             if not href or "/career/jobs-netherlands/" not in href:
                 continue
             parts = href.rstrip("/").split("/")
@@ -69,7 +92,7 @@ class IamExpatScraper(BaseScraper):
                 continue
             seen_urls.add(full_url)
 
-            text = await card.inner_text()
+            text = card["text"]
             lines = [l.strip() for l in text.split("\n") if l.strip()]
             title = lines[0] if lines else ""
             company = lines[1] if len(lines) > 1 else ""
@@ -84,23 +107,17 @@ class IamExpatScraper(BaseScraper):
         """Fetch full JD from detail page."""
         try:
             await page.goto(url, wait_until="domcontentloaded", timeout=20000)
-            await page.wait_for_timeout(500)  # Let Next.js hydrate
-            ld_el = await page.query_selector('script[type="application/ld+json"]')
-            if ld_el:
-                ld_text = await ld_el.inner_text()
-                ld = json.loads(ld_text)
-                desc = ld.get("description", "")
-                if desc:
-                    return desc
-            content = await page.query_selector("article, .job-description, main")
-            if content:
-                return await content.inner_text()
-            return await page.inner_text("body")
+            try:
+                await page.wait_for_selector(DETAIL_READY_SELECTOR, state="attached", timeout=3000)
+            except Exception:
+                pass  # Fall through to the body-text fallback below
+            return await page.evaluate(DETAIL_CONTENT_SCRIPT)
         except Exception as e:
             logger.warning("[IamExpat] Failed to fetch detail %s: %s", url[:60], e)
             return ""
 
-    async def _fetch_detail_for_card(self, context, card: Dict, query: str, semaphore: asyncio.Semaphore) -> Dict:
+    async def _fetch_detail_for_card(self, context, card: Dict, query: str, semaphore: asyncio.Semaphore,
+                                     scraped_at: str | None = None) -> Dict:
         async with semaphore:
             detail_page = await context.new_page()
             try:
@@ -114,15 +131,18 @@ class IamExpatScraper(BaseScraper):
             url=card["url"],
             description=desc,
             query=query,
+            scraped_at=scraped_at,
         )
 
-    async def _scrape_query(self, context, page, query_cfg: Dict, seen_urls: set[str]) -> List[Dict]:
+    async def _scrape_query(self, context, page, query_cfg: Dict, seen_urls: set[str],
+                            detail_semaphore: asyncio.Semaphore | None = None) -> List[Dict]:
         kw = query_cfg["keywords"]
         category = query_cfg.get("category", CATEGORY_PATH)
         logger.info("[IamExpat] Searching: %s (category: %s)", kw, category)
 
         jobs: List[Dict] = []
-        semaphore = asyncio.Semaphore(self.detail_concurrency)
+        semaphore = detail_semaphore or asyncio.Semaphore(self.detail_concurrency)
+        scraped_at = datetime.now().isoformat()  # One timestamp for the query's whole batch
         for page_num in range(1, self.max_pages + 1):
             base = f"{BASE_URL}/{category}" if category else BASE_URL
             url = f"{base}?search={kw.replace(' ', '+')}&page={page_num}"
@@ -150,6 +170,7 @@ class IamExpatScraper(BaseScraper):
                         card,
                         kw,
                         semaphore,
+                        scraped_at,
                     )
                 )
             if detail_tasks:
@@ -173,17 +194,30 @@ class IamExpatScraper(BaseScraper):
             context = await browser.new_context(
                 user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
             )
-            page = await context.new_page()
+            await install_resource_blocking(context)
+            # Queries run in their own tabs; detail fetches share one budget across all of them.
+            query_semaphore = asyncio.Semaphore(self.query_concurrency)
+            detail_semaphore = asyncio.Semaphore(self.detail_concurrency)
 
-            for query_cfg in self.queries:
+            async def run_query(query_cfg: Dict) -> List[Dict]:
                 kw = query_cfg["keywords"]
-                try:
-                    query_jobs = await self._scrape_query(context, page, query_cfg, seen_urls)
-                    all_jobs.extend(query_jobs)
-                    self.record_target_success(kw)
-                except Exception as e:
-                    self.record_target_failure(kw, e)
-                    logger.warning("[IamExpat] Query '%s' failed: %s", kw, e)
+                async with query_semaphore:
+                    page = await context.new_page()
+                    try:
+                        query_jobs = await self._scrape_query(
+                            context, page, query_cfg, seen_urls, detail_semaphore
+                        )
+                    except Exception as e:
+                        self.record_target_failure(kw, e)
+                        logger.warning("[IamExpat] Query '%s' failed: %s", kw, e)
+                        return []
+                    finally:
+                        await page.close()
+                self.record_target_success(kw)
+                return query_jobs
+
+            for query_jobs in await asyncio.gather(*(run_query(q) for q in self.queries)):
+                all_jobs.extend(query_jobs)
 
             await browser.close()
         return all_jobs
@@ -20,6 +20,9 @@ from src.scrapers.utils import run_async
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_QUERY_CONCURRENCY = 2
+DEFAULT_MAX_CONCURRENT_NAVIGATIONS = 2
+
 
 class LinkedInScraper(BaseScraper):
     source_name = "LinkedIn"
@@ -32,18 +35,36 @@ class LinkedInScraper(BaseScraper):
     ):
         super().__init__()
         self.profile = profile
-        self.browser = browser or LinkedInBrowser()
         self.config_path = (
             Path(config_path)
             if config_path
             else Path(__file__).resolve().parents[2] / "config" / "search_profiles.yaml"
         )
         self.config = self._load_config()
+        defaults = self.config.get("defaults", {})
+        self.browser = browser or LinkedInBrowser(
+            user_data_dir=self._browser_profile_dir(),
+            ws_endpoint=defaults.get("browser_ws_endpoint") or None,
+            use_cdp=bool(defaults.get("browser_cdp_url")),
+            cdp_url=defaults.get("browser_cdp_url") or "http://localhost:9222",
+            max_concurrent_navigations=int(
+                defaults.get("max_concurrent_navigations", DEFAULT_MAX_CONCURRENT_NAVIGATIONS)
+            ),
+        )
+        self._session_lost = False
 
     def _load_config(self) -> dict:
         with open(self.config_path, "r", encoding="utf-8") as f:
             return yaml.safe_load(f) or {}
 
+    def _browser_profile_dir(self) -> Path | None:
+        """Optional persistent Chromium profile (defaults.user_data_dir), relative to the project root."""
+        value = self.config.get("defaults", {}).get("user_data_dir")
+        if not value:
+            return None
+        path = Path(value)
+        return path if path.is_absolute() else Path(__file__).resolve().parents[2] / path
+
     def _get_profile(self) -> dict:
         profiles = self.config.get("profiles", {})
         profile = profiles.get(self.profile)
@@ -61,12 +82,133 @@ class LinkedInScraper(BaseScraper):
             if profile and profile.get("enabled", True)
         ]
 
+    async def _scrape_query(
+        self,
+        browser,
+        profile_name: str,
+        keywords: str,
+        defaults: dict,
+        seen_ids: set[str],
+        scraped_at: str,
+    ) -> tuple[dict, list[dict]]:
+        """Search one query and enrich its new cards. Returns (query diagnostics, jobs)."""
+        jobs: list[dict] = []
+        jobs_enriched = 0
+        cards_found = 0
+        status = "ok"
+        error = ""
+        # Per-query stage/URL: browser.diagnostics is shared by every concurrent query.
+        trace = {"last_stage": "search", "last_url": ""}
+        try:
+            cards = await browser.search_jobs(
+                keywords,
+                location=defaults.get("location", "Netherlands"),
+                max_jobs=int(defaults.get("max_jobs", 100)),
+                date_posted=defaults.get("date_posted", "r86400"),
+                sort_by=defaults.get("sort_by", "DD"),
+                job_type=defaults.get("job_type"),
+                workplace_type=defaults.get("workplace_type"),
+                language=defaults.get("language"),
+                trace=trace,
+            )
+            parsed_jobs = parse_search_cards(cards)
+            cards_found = len(cards)
+
+            card_ids = [JobDatabase.generate_job_id(j["url"]) if j.get("url") else "" for j in parsed_jobs]
+            # Cards an earlier query already classified are dropped below as repeats,
+            # so only the unseen ones need the DB round-trip.
+            known_ids = self.db.find_existing_job_ids(
+                [j["url"] for j, job_id in zip(parsed_jobs, card_ids) if job_id and job_id not in seen_ids],
+                since_days=self.dedup_window_days,
+            )
+
+            # One pass classifies every card before any detail fetch is issued.
+            # Blacklisted cards never reach the jobs table, so the DB cannot dedup them
+            # across runs; they skip the JD fetch and go straight to run()'s blacklist count.
+            pending: list[dict] = []
+            blacklisted: list[dict] = []
+            repeated = known = 0
+            for job, job_id in zip(parsed_jobs, card_ids):
+                url = job.get("url", "")
+                if not url or job_id in seen_ids:
+                    repeated += 1
+                    continue
+                seen_ids.add(job_id)
+                if job_id in known_ids:
+                    known += 1
+                    continue
+                if self.is_blacklisted(job):
+                    blacklisted.append(job)
+                    continue
+                pending.append(job)
+            logger.info(
+                "[LinkedIn] %s: %d cards, %d new, %d known, %d repeated, %d blacklisted",
+                keywords[:60],
+                cards_found,
+                len(pending),
+                known,
+                repeated,
+                len(blacklisted),
+            )
+            for job in blacklisted:
+                job.update(scraped_at=scraped_at, search_profile=profile_name, search_query=keywords)
+                jobs.append(job)
+
+            for job in pending:
+                url = job["url"]
+                trace.update(last_stage="detail_fetch", last_url=url)
+                try:
+                    payload = await browser.fetch_job_description(url)
+                    description = extract_job_description(payload)
+                    if description:
+                        job["description"] = description
+                        jobs_enriched += 1
+                except (LinkedInSessionError, LinkedInCaptchaError):
+                    raise
+                except Exception as exc:
+                    logger.warning("[LinkedIn] JD fetch failed for %s: %s", url, exc)
+
+                if not job.get("description"):
+                    logger.debug("[LinkedIn] Skipping new job without description: %s", url[:80])
+                    continue
+
+                job["scraped_at"] = scraped_at
+                job["search_profile"] = profile_name
+                job["search_query"] = keywords
+                jobs.append(job)
+
+                await asyncio.sleep(random.uniform(2.0, 4.0))
+
+            self.record_target_success(keywords)
+        except (LinkedInSessionError, LinkedInCaptchaError) as exc:
+            status, error = "error", str(exc)
+            self.record_target_failure(keywords, exc)
+            logger.warning("[LinkedIn] Session lost at query '%s', aborting remaining queries", keywords)
+            self._session_lost = True
+        except Exception as exc:
+            status, error = "error", str(exc)
+            self.record_target_failure(keywords, exc)
+
+        query_diag = {
+            "profile": profile_name,
+            "query": keywords,
+            "status": status,
+            "cards_found": cards_found,
+            "jobs_enriched": jobs_enriched,
+            "last_stage": trace["last_stage"],
+            "last_url": trace["last_url"],
+            "error": error,
+        }
+        return query_diag, jobs
+
     async def _scrape_async(self) -> list[dict]:
         defaults = self.config.get("defaults", {})
         jobs: list[dict] = []
         query_diagnostics: list[dict] = []
         profile_scope = [name for name, _ in self._iter_active_profiles()]
         seen_ids: set[str] = set()
+        self._session_lost = False
+        scraped_at = datetime.now().isoformat()  # One timestamp for the whole batch
 
         async with self.browser as browser:
             try:
@@ -89,112 +231,32 @@ class LinkedInScraper(BaseScraper):
                 )
                 return []
 
-            session_lost = False
-            for profile_name, profile in self._iter_active_profiles():
-                if session_lost:
-                    break
-                for query in profile.get("queries", []):
-                    keywords = query.get("keywords", "")
-                    if not keywords:
-                        continue
-                    jobs_enriched = 0
-                    cards_found = 0
-                    try:
-                        cards = await browser.search_jobs(
-                            keywords,
-                            location=defaults.get("location", "Netherlands"),
-                            max_jobs=int(defaults.get("max_jobs", 100)),
-                            date_posted=defaults.get("date_posted", "r86400"),
-                            sort_by=defaults.get("sort_by", "DD"),
-                            job_type=defaults.get("job_type"),
-                            workplace_type=defaults.get("workplace_type"),
-                            language=defaults.get("language"),
-                        )
-                        parsed_jobs = parse_search_cards(cards)
-                        cards_found = len(cards)
-
-                        card_urls = [j.get("url", "") for j in parsed_jobs]
-                        known_ids = self.db.find_existing_job_ids(card_urls, since_days=self.dedup_window_days)
-
-                        for job in parsed_jobs:
-                            url = job.get("url", "")
-                            job_id = JobDatabase.generate_job_id(url) if url else ""
-                            if not url or job_id in seen_ids:
-                                continue
-                            seen_ids.add(job_id)
-
-                            if job_id in known_ids:
-                                continue
-
-                            try:
-                                payload = await browser.fetch_job_description(url)
-                                description = extract_job_description(payload)
-                                if description:
-                                    job["description"] = description
-                                    jobs_enriched += 1
-                            except (LinkedInSessionError, LinkedInCaptchaError):
-                                raise
-                            except Exception as exc:
-                                logger.warning("[LinkedIn] JD fetch failed for %s: %s", url, exc)
-
-                            if not job.get("description"):
-                                logger.debug("[LinkedIn] Skipping new job without description: %s", url[:80])
-                                continue
-
-                            job["scraped_at"] = datetime.now().isoformat()
-                            job["search_profile"] = profile_name
-                            job["search_query"] = keywords
-                            jobs.append(job)
-
-                            await asyncio.sleep(2.0 + random.random() * 2.0)
-
-                        browser_diag = dict(getattr(browser, "diagnostics", {}))
-                        query_diagnostics.append(
-                            {
-                                "profile": profile_name,
-                                "query": keywords,
-                                "status": "ok",
-                                "cards_found": cards_found,
-                                "jobs_enriched": jobs_enriched,
-                                "last_stage": browser_diag.get("last_stage", ""),
-                                "last_url": browser_diag.get("last_url", ""),
-                                "error": "",
-                            }
-                        )
-                        self.record_target_success(keywords)
-                    except (LinkedInSessionError, LinkedInCaptchaError) as exc:
-                        browser_diag = dict(getattr(browser, "diagnostics", {}))
-                        query_diagnostics.append(
-                            {
-                                "profile": profile_name,
-                                "query": keywords,
-                                "status": "error",
-                                "cards_found": cards_found,
-                                "jobs_enriched": jobs_enriched,
-                                "last_stage": browser_diag.get("last_stage", ""),
-                                "last_url": browser_diag.get("last_url", ""),
-                                "error": str(exc),
-                            }
-                        )
-                        self.record_target_failure(keywords, exc)
-                        logger.warning("[LinkedIn] Session lost at query '%s', aborting remaining queries", keywords)
-                        session_lost = True
-                        break
-                    except Exception as exc:
-                        browser_diag = dict(getattr(browser, "diagnostics", {}))
-                        query_diagnostics.append(
-                            {
-                                "profile": profile_name,
-                                "query": keywords,
-                                "status": "error",
-                                "cards_found": cards_found,
-                                "jobs_enriched": jobs_enriched,
-                                "last_stage": browser_diag.get("last_stage", ""),
-                                "last_url": browser_diag.get("last_url", ""),
-                                "error": str(exc),
-                            }
-                        )
-                        self.record_target_failure(keywords, exc)
+            # Queries share one browser session; the semaphore bounds how many tabs search at once.
+            semaphore = asyncio.Semaphore(max(1, int(defaults.get("query_concurrency", DEFAULT_QUERY_CONCURRENCY))))
+
+            async def run_query(profile_name: str, keywords: str):
+                async with semaphore:
+                    if self._session_lost:
+                        return None
+                    return await self._scrape_query(
+                        browser, profile_name, keywords, defaults, seen_ids, scraped_at
+                    )
+
+            results = await asyncio.gather(
+                *(
+                    run_query(profile_name, query.get("keywords", ""))
+                    for profile_name, profile in self._iter_active_profiles()
+                    for query in profile.get("queries", [])
+                    if query.get("keywords", "")
+                )
+            )
+            for result in results:
+                if result is None:
+                    continue
+                query_diag, query_jobs = result
+                query_diagnostics.append(query_diag)
+                jobs.extend(query_jobs)
+
             browser_diag = dict(getattr(browser, "diagnostics", {}))
             self.update_diagnostics(
                 profile_scope=profile_scope,
@@ -1,17 +1,27 @@
 import asyncio
-import json
+import hashlib
 import logging
+import os
 import random
-import re
+from contextlib import asynccontextmanager
 from pathlib import Path
 from urllib.parse import urlencode
 
+import orjson
 from playwright.async_api import TimeoutError as PlaywrightTimeout
 from playwright.async_api import async_playwright
 
+from src.scrapers.linkedin_parser import canonical_job_url, extract_first_class_html, linkedin_job_id
+from src.scrapers.utils import AdaptiveLimiter, install_resource_blocking
+
 logger = logging.getLogger(__name__)
 
 COOKIES_FILE = Path(__file__).resolve().parents[2] / "config" / "linkedin_cookies.json"
+FEED_URL = "https://www.linkedin.com/feed/"
+# Optional-element actions (e.g. clicking "Show more") fail fast instead of Playwright's 30s default;
+# every required wait and navigation passes its own timeout.
+ACTION_TIMEOUT_MS = 2000
+NAVIGATION_TIMEOUT_MS = 30000
 USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
 AUTH_MARKERS = ("/login", "/checkpoint", "/authwall", "/uas/")
 CAPTCHA_MARKERS = ("captcha", "challenge", "verify you are human", "security check")
@@ -30,6 +40,8 @@ SEARCH_CARD_SELECTORS = (
     ".scaffold-layout__list-item",
     "[data-job-id]",
 )
+SEARCH_CARD_SELECTOR = ", ".join(SEARCH_CARD_SELECTORS)
+SEARCH_PAGE_SIZE = 25
 DETAIL_SELECTORS = (
     ".jobs-description__content",
     ".jobs-box__html-content",
@@ -41,14 +53,184 @@ DETAIL_SELECTORS = (
     "[class*='description']",
     ".job-view-layout",
 )
-GUEST_DETAIL_SELECTORS = (
-    ".show-more-less-html__markup",
-    ".description__text--rich",
-    ".description__text",
-    ".decorated-job-posting__details",
+DETAIL_READY_SELECTOR = ", ".join(DETAIL_SELECTORS[:3])
+SHOW_MORE_SELECTORS = (
+    "button[aria-label*='Show more']",
+    "button[aria-label*='See more']",
+    "button.show-more-less-html__button",
+)
+# Installed once per context via add_init_script so V8 parses the helpers once per
+# document; each evaluate then only ships a one-line call.
+PAGE_HELPERS_SCRIPT = """
+window.__jhRevealCards = async (selectors, maxRounds = 4) => {
+    const nextFrame = () => new Promise((resolve) => requestAnimationFrame(() => setTimeout(resolve, 50)));
+    const selector = selectors.find((candidate) => document.querySelector(candidate));
+    if (!selector) {
+        return { selector: null, total: 0 };
+    }
+    // Resolve once the card list has been quiet for 300ms (capped at 1.5s), driven by a
+    // MutationObserver rather than polling the count on a timer.
+    const settle = () => new Promise((resolve) => {
+        const list = document.querySelector(selector).parentElement || document.body;
+        let quiet = null;
+        let ceiling = null;
+        const observer = new MutationObserver(() => {
+            clearTimeout(quiet);
+            quiet = setTimeout(done, 300);
+        });
+        function done() {
+            observer.disconnect();
+            clearTimeout(quiet);
+            clearTimeout(ceiling);
+            resolve(document.querySelectorAll(selector).length);
+        }
+        observer.observe(list, { childList: true, subtree: true });
+        quiet = setTimeout(done, 300);
+        ceiling = setTimeout(done, 1500);
+    });
+    // Only occluded (not yet hydrated) cards need a scroll; the last card is always
+    // touched so LinkedIn can append more. Stop once the card count stops growing.
+    let total = 0;
+    for (let round = 0; round < maxRounds; round++) {
+        const cards = Array.from(document.querySelectorAll(selector));
+        for (const [index, card] of cards.entries()) {
+            if (card.querySelector('a[href*="/jobs/view/"]') && index !== cards.length - 1) {
+                continue;
+            }
+            card.scrollIntoView({ block: 'center' });
+            await nextFrame();
+        }
+        total = await settle();
+        if (total === cards.length) {
+            break;
+        }
+    }
+    return { selector, total };
+};
+window.__jhExtractCards = (selectors) => {
+    const items = [];
+    for (const selector of selectors) {
+        const cards = Array.from(document.querySelectorAll(selector));
+        if (!cards.length) {
+            continue;
+        }
+        for (const card of cards) {
+            const titleEl = card.querySelector('.job-card-list__title strong, .job-card-list__title, h3 strong, a[class*="title"]');
+            const companyEl = card.querySelector('.job-card-container__company-name, .artdeco-entity-lockup__subtitle, .job-card-container__company-link, .job-card-container__primary-description');
+            const locationEl = card.querySelector('.job-card-container__metadata-item, .artdeco-entity-lockup__caption');
+            const linkEl = card.querySelector('a[href*="/jobs/view/"]') || card.querySelector('a.job-card-list__title') || card.querySelector('a');
+            const href = linkEl ? (linkEl.getAttribute('href') || '') : '';
+            const timeEl = card.querySelector('time[datetime]');
+            items.push({
+                title: titleEl ? (titleEl.textContent || '').trim() : '',
+                company: companyEl ? (companyEl.textContent || '').trim() : '',
+                location: locationEl ? (locationEl.textContent || '').trim() : '',
+                url: href,
+                posted: timeEl ? (timeEl.getAttribute('datetime') || '') : '',
+            });
+        }
+        if (items.length) {
+            break;
+        }
+    }
+    return items;
+};
+// Text + HTML of the first selector with content, instead of a round-trip per candidate.
+window.__jhReadFirstContent = (selectors) => {
+    for (const selector of selectors) {
+        const element = document.querySelector(selector);
+        if (!element) {
+            continue;
+        }
+        const text = (element.innerText || '').trim();
+        const html = (element.innerHTML || '').trim();
+        if (text || html) {
+            return { text, html };
+        }
+    }
+    return { text: '', html: '' };
+};
+window.__jhReadJobPostingLd = () => {
+    // Server-rendered schema.org JobPosting: present at DOMContentLoaded, before hydration.
+    for (const script of document.querySelectorAll('script[type="application/ld+json"]')) {
+        let data;
+        try {
+            data = JSON.parse(script.textContent || '');
+        } catch (error) {
+            continue;
+        }
+        const nodes = Array.isArray(data) ? data : (data['@graph'] || [data]);
+        for (const node of nodes) {
+            if (node && node['@type'] === 'JobPosting' && node.description) {
+                return String(node.description);
+            }
+        }
+    }
+    return '';
+};
+window.__jhFindChallengeMarker = (markers) => {
+    // Scan the visible text in-page so only a hit (marker + snippet) crosses the wire.
+    const text = ((document.body && document.body.innerText) || '').toLowerCase();
+    for (const marker of markers) {
+        const index = text.indexOf(marker);
+        if (index >= 0) {
+            const snippet = text.slice(Math.max(0, index - 160), index + 160).replace(/\\n/g, ' ');
+            return { marker, snippet };
+        }
+    }
+    return null;
+};
+// Clicks the first visible expander and reports which one.
+window.__jhClickShowMore = (selectors) => {
+    for (const selector of selectors) {
+        const button = document.querySelector(selector);
+        if (button && button.offsetParent !== null) {
+            button.click();
+            return selector;
+        }
+    }
+    return null;
+};
+window.__jhShowMoreExpanded = (selector) => {
+    const button = document.querySelector(selector);
+    return !button || button.offsetParent === null || button.getAttribute('aria-expanded') === 'true';
+};
+"""
+REVEAL_CARDS_CALL = "(selectors) => window.__jhRevealCards(selectors)"
+EXTRACT_CARDS_CALL = "(selectors) => window.__jhExtractCards(selectors)"
+READ_FIRST_CONTENT_CALL = "(selectors) => window.__jhReadFirstContent(selectors)"
+READ_JOB_POSTING_LD_CALL = "() => window.__jhReadJobPostingLd()"
+FIND_CHALLENGE_MARKER_CALL = "(markers) => window.__jhFindChallengeMarker(markers)"
+CLICK_SHOW_MORE_CALL = "(selectors) => window.__jhClickShowMore(selectors)"
+SHOW_MORE_EXPANDED_CALL = "(selector) => window.__jhShowMoreExpanded(selector)"
+GUEST_MAX_CONCURRENCY = 8
+GUEST_DETAIL_CLASSES = (
+    "show-more-less-html__markup",
+    "description__text--rich",
+    "description__text",
+    "decorated-job-posting__details",
 )
 
 
+def _digest(payload: bytes) -> bytes:
+    return hashlib.blake2b(payload, digest_size=16).digest()
+
+
+def url_key(url: str) -> int:
+    """Compact dedup key: the numeric LinkedIn job id, else a 64-bit SHA-1 prefix of the URL."""
+    job_id = linkedin_job_id(url)
+    if job_id is not None:
+        return job_id
+    return int.from_bytes(hashlib.sha1(url.encode()).digest()[:8], "little")
+
+
+def write_bytes_atomic(path: Path, payload: bytes) -> None:
+    """Write via a sibling temp file + os.replace so a crash never leaves a truncated file."""
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_bytes(payload)
+    os.replace(tmp_path, path)
+
+
 class LinkedInBrowserError(Exception):
     """Base browser-layer error for LinkedIn scraping."""
 
@@ -61,6 +243,42 @@ class LinkedInCaptchaError(LinkedInBrowserError):
     """Raised when a CAPTCHA or challenge page is detected."""
 
 
+class LinkedInRateLimitError(LinkedInBrowserError):
+    """Raised when LinkedIn answers HTTP 429."""
+
+
+def guest_posting_url(url: str) -> str | None:
+    """Map a /jobs/view/<id> URL onto LinkedIn's public guest posting endpoint."""
+    job_id = linkedin_job_id(url)
+    if job_id is None:
+        return None
+    return f"https://www.linkedin.com/jobs-guest/jobs/api/jobPosting/{job_id}"
+
+
+async def fetch_guest_description(request, url: str) -> dict:
+    """Fetch the guest posting for ``url`` over plain HTTP and return the raw JD payload.
+
+    ``request`` is a Playwright APIRequestContext (``context.request``, ``page.request`` or
+    ``playwright.request.new_context()``): the fragment is parsed in-process, never rendered.
+    Shared by the scraper and the backfill script so both read the same selectors.
+    """
+    payload = {"json_ld_description": "", "detail_text": "", "detail_html": ""}
+    guest_url = guest_posting_url(url)
+    if not guest_url:
+        return payload
+    resp = await request.get(guest_url, timeout=15000)
+    try:
+        if resp.status == 429:
+            raise LinkedInRateLimitError(f"Guest API rate-limited (HTTP 429) for {url}")
+        if resp.status != 200:
+            logger.debug("[LinkedIn] Guest API returned %s for %s", resp.status, url)
+            return payload
+        payload["detail_html"] = extract_first_class_html(await resp.text(), GUEST_DETAIL_CLASSES)
+    finally:
+        await resp.dispose()
+    return payload
+
+
 class LinkedInBrowser:
     def __init__(
         self,
@@ -69,15 +287,48 @@ class LinkedInBrowser:
         cookies_path: Path | None = None,
         use_cdp: bool = False,
         cdp_url: str = "http://localhost:9222",
+        user_data_dir: Path | None = None,
+        ws_endpoint: str | None = None,
+        max_concurrent_navigations: int = 2,
     ):
+        """Configure how Chromium is obtained; nothing starts until ``async with``.
+
+        The browser source is picked in this order: ``use_cdp`` attaches to ``cdp_url``,
+        then ``ws_endpoint`` connects to a ``launch_server`` instance, then ``user_data_dir``
+        launches a persistent profile, else a fresh headless Chromium is launched. A remote
+        browser keeps its own profile, so ``user_data_dir`` is ignored (with a warning)
+        when ``ws_endpoint`` is also set.
+        """
+        if ws_endpoint and user_data_dir and not use_cdp:
+            logger.warning(
+                "[LinkedIn] browser_ws_endpoint is set; ignoring user_data_dir %s (the remote browser keeps its own profile)",
+                user_data_dir,
+            )
         self.headless = headless
         self.cookies_path = Path(cookies_path) if cookies_path else COOKIES_FILE
+        # Playwright storage state (cookies + localStorage); cookies_path is the first-run fallback.
+        self.state_path = self.cookies_path.with_suffix(".state.json")
         self.use_cdp = use_cdp
         self.cdp_url = cdp_url
+        # Persistent Chromium profile: HTTP cache and cookies survive between runs.
+        self.user_data_dir = Path(user_data_dir) if user_data_dir else None
+        # Long-lived Chromium started with `launch_server`: skips the cold start on every run.
+        self.ws_endpoint = ws_endpoint
+        # Caps in-flight LinkedIn page loads across all concurrent queries and detail fetches.
+        self._navigation_slots = asyncio.Semaphore(max(1, max_concurrent_navigations))
+        # Guest API calls are plain HTTP: their cap adapts to LinkedIn's 429s instead.
+        self._guest_slots = AdaptiveLimiter(max_concurrent_navigations, maximum=GUEST_MAX_CONCURRENCY)
         self.playwright = None
         self.browser = None
         self.context = None
         self.page = None
+        self._idle_pages: list = []
+        self._storage_state: dict | None = None
+        self._context_seeded = False
+        self._state_digest = b""
+        # Card selector that matched on the first search page; LinkedIn's layout is stable
+        # for a session, so later pages skip probing the fallbacks.
+        self._card_selector: str | None = None
         self.diagnostics = {
             "session_status": "unknown",
             "last_stage": "init",
@@ -85,29 +336,52 @@ class LinkedInBrowser:
             "challenge_marker": "",
             "cards_found": 0,
             "detail_fetch_failures": 0,
+            "guest_rate_limited": 0,
             "cookies_path": str(self.cookies_path),
             "cookies_loaded": 0,
         }
 
     async def __aenter__(self):
+        self._storage_state = await asyncio.to_thread(self._read_storage_state)
         self.playwright = await async_playwright().start()
         if self.use_cdp:
             self.browser = await self.playwright.chromium.connect_over_cdp(self.cdp_url)
-            self.context = self.browser.contexts[0] if self.browser.contexts else await self.browser.new_context(
-                user_agent=USER_AGENT
+            if self.browser.contexts:
+                self.context = self.browser.contexts[0]
+            else:
+                self.context = await self.browser.new_context(**self._context_options())
+                self._context_seeded = self._storage_state is not None
+        elif self.ws_endpoint:
+            self.browser = await self.playwright.chromium.connect(self.ws_endpoint)
+            self.context = await self.browser.new_context(**self._context_options())
+            self._context_seeded = self._storage_state is not None
+        elif self.user_data_dir is not None:
+            self.user_data_dir.mkdir(parents=True, exist_ok=True)
+            self.context = await self.playwright.chromium.launch_persistent_context(
+                str(self.user_data_dir), headless=self.headless, user_agent=USER_AGENT
             )
         else:
             self.browser = await self.playwright.chromium.launch(headless=self.headless)
-            self.context = await self.browser.new_context(user_agent=USER_AGENT)
+            self.context = await self.browser.new_context(**self._context_options())
+            self._context_seeded = self._storage_state is not None
 
+        await self._prepare_context(self.context)
         await self._load_cookies()
         self.page = await self.context.new_page()
+        self._idle_pages = [self.page]
         return self
 
     async def __aexit__(self, exc_type, exc, tb):
+        try:
+            await self._persist_storage_state()
+        except Exception as persist_exc:
+            logger.warning("[LinkedIn] Could not persist refreshed session state: %s", persist_exc)
         try:
             if self.browser:
+                # For a ws_endpoint connection this only disconnects; the server keeps running.
                 await self.browser.close()
+            elif self.context:
+                await self.context.close()
         except Exception:
             pass
         try:
@@ -117,15 +391,40 @@ class LinkedInBrowser:
             pass
         return False
 
+    def _read_storage_state(self) -> dict | None:
+        if not self.state_path.exists():
+            return None
+        if self.cookies_path.exists() and self.cookies_path.stat().st_mtime > self.state_path.stat().st_mtime:
+            # Freshly re-exported cookies supersede a saved state that may have expired.
+            logger.info("[LinkedIn] %s is newer than the saved session state; using it", self.cookies_path.name)
+            return None
+        raw_bytes = self.state_path.read_bytes()
+        try:
+            state = orjson.loads(raw_bytes)
+        except orjson.JSONDecodeError:
+            logger.warning("[LinkedIn] Ignoring unreadable storage state: %s", self.state_path)
+            return None
+        if not isinstance(state, dict) or not isinstance(state.get("cookies"), list):
+            return None
+        self._state_digest = _digest(raw_bytes)
+        return state
+
+    def _context_options(self) -> dict:
+        options = {"user_agent": USER_AGENT}
+        if self._storage_state is not None:
+            options["storage_state"] = self._storage_state
+        return options
+
     async def _load_cookies(self) -> None:
         self.diagnostics["last_stage"] = "load_cookies"
-        if not self.cookies_path.exists():
+        if self._storage_state is not None:
+            raw_cookies = self._storage_state["cookies"]
+        elif self.cookies_path.exists():
+            raw_cookies = orjson.loads(await asyncio.to_thread(self.cookies_path.read_bytes))
+        else:
             self.diagnostics["session_status"] = "cookies_missing"
             raise LinkedInSessionError(f"LinkedIn cookies file not found: {self.cookies_path}")
 
-        with open(self.cookies_path, "r", encoding="utf-8") as f:
-            raw_cookies = json.load(f)
-
         valid_cookies = []
         for cookie in (raw_cookies if isinstance(raw_cookies, list) else []):
             if not isinstance(cookie, dict):
@@ -141,13 +440,93 @@ class LinkedInBrowser:
             self.diagnostics["session_status"] = "cookies_missing_li_at"
             raise LinkedInSessionError("LinkedIn session cookie li_at is missing")
 
-        await self.context.add_cookies(valid_cookies)
+        # A context created from storage_state already carries the cookies (and localStorage);
+        # reused CDP and persistent-profile contexts do not take that option.
+        if not self._context_seeded:
+            await self.context.add_cookies(valid_cookies)
         self.diagnostics["session_status"] = "cookies_loaded"
         self.diagnostics["cookies_loaded"] = len(valid_cookies)
 
+    async def _persist_storage_state(self) -> bool:
+        """Write back LinkedIn's rotated session state, skipping the write when nothing changed."""
+        if self.context is None or self.diagnostics.get("session_status") != "ok":
+            return False
+        state = await self.context.storage_state()
+        state["cookies"] = [
+            cookie for cookie in state.get("cookies", [])
+            if "linkedin.com" in cookie.get("domain", "")
+        ]
+        if not any(cookie.get("name") == "li_at" for cookie in state["cookies"]):
+            return False
+        payload = orjson.dumps(state, option=orjson.OPT_INDENT_2)
+        digest = _digest(payload)
+        if digest == self._state_digest:
+            return False
+        # Off the event loop: other contexts may still be closing pages concurrently.
+        await asyncio.to_thread(write_bytes_atomic, self.state_path, payload)
+        self._state_digest = digest
+        return True
+
+    async def _prepare_context(self, context) -> None:
+        context.set_default_timeout(ACTION_TIMEOUT_MS)
+        context.set_default_navigation_timeout(NAVIGATION_TIMEOUT_MS)
+        await install_resource_blocking(context)
+        await context.add_init_script(PAGE_HELPERS_SCRIPT)
+
+    @asynccontextmanager
+    async def _borrow_page(self):
+        """Lend a tab from the context's pool so concurrent searches never share a page."""
+        page = self._idle_pages.pop() if self._idle_pages else await self.context.new_page()
+        try:
+            yield page
+        finally:
+            self._idle_pages.append(page)
+
     async def validate_session(self) -> bool:
+        """Check the session, falling back from an expired saved state to the cookies file once."""
+        try:
+            return await self._check_session()
+        except LinkedInSessionError:
+            if self._storage_state is None or not self.cookies_path.exists():
+                raise
+            logger.warning("[LinkedIn] Saved session state expired; retrying with %s", self.cookies_path)
+        self._storage_state = None
+        self._state_digest = b""
+        self._context_seeded = False
+        await self._load_cookies()
+        return await self._check_session()
+
+    async def _check_session(self) -> bool:
+        """Check the session with one redirect-free HTTP request; render /feed/ only if inconclusive."""
         self.diagnostics["last_stage"] = "validate_session"
-        await self._goto("https://www.linkedin.com/feed/", timeout=30000)
+        self.diagnostics["last_url"] = FEED_URL
+        try:
+            resp = await self.context.request.get(FEED_URL, max_redirects=0, timeout=15000)
+        except Exception as exc:
+            logger.debug("[LinkedIn] Session preflight failed, falling back to navigation: %s", exc)
+            return await self._validate_session_by_navigation()
+
+        status = resp.status
+        location = resp.headers.get("location", "")
+        await resp.dispose()
+        if 300 <= status < 400:
+            if any(marker in location.lower() for marker in CHALLENGE_URL_MARKERS):
+                self.diagnostics["last_url"] = location
+                self.diagnostics["session_status"] = "challenge"
+                self.diagnostics["challenge_marker"] = f"redirect:{location}"
+                raise LinkedInCaptchaError("LinkedIn CAPTCHA or challenge page detected")
+            if self._is_auth_url(location):
+                self.diagnostics["last_url"] = location
+                self.diagnostics["session_status"] = "auth_redirect"
+                raise LinkedInSessionError(f"LinkedIn session expired: redirected to {location}")
+        if status == 200:
+            self.diagnostics["session_status"] = "ok"
+            return True
+        logger.debug("[LinkedIn] Session preflight inconclusive (HTTP %s), falling back to navigation", status)
+        return await self._validate_session_by_navigation()
+
+    async def _validate_session_by_navigation(self) -> bool:
+        await self._goto(FEED_URL, timeout=30000)
         if self._is_auth_url(self.page.url):
             self.diagnostics["session_status"] = "auth_redirect"
             raise LinkedInSessionError(f"LinkedIn session expired: redirected to {self.page.url}")
@@ -167,8 +546,14 @@ class LinkedInBrowser:
         workplace_type: str | None = None,
         language: str | None = None,
         max_pages: int = 4,
+        trace: dict | None = None,
     ) -> list[dict]:
-        self.diagnostics["last_stage"] = "search"
+        """Collect deduplicated cards for one query.
+
+        ``trace`` receives this query's own last_stage/last_url/cards_found, since concurrent
+        queries would otherwise overwrite each other's values in ``self.diagnostics``.
+        """
+        self._note(trace, last_stage="search")
         params = {
             "keywords": keywords,
             "location": location,
@@ -182,41 +567,66 @@ class LinkedInBrowser:
         if language:
             params["f_JC"] = language
 
-        all_cards: list[dict] = []
-        seen_urls: set[str] = set()
-
-        for page in range(max_pages):
-            page_params = dict(params)
-            if page > 0:
-                page_params["start"] = page * 25
-            await self._goto(
-                f"https://www.linkedin.com/jobs/search?{urlencode(page_params)}",
-                timeout=45000,
+        # Page one runs alone: it settles the card selector, and a short page means there is no
+        # second page to request. Only after a full page are the remaining ?start= offsets loaded
+        # concurrently (bounded by the navigation cap) and merged back in page order.
+        pages_needed = max_pages if max_jobs <= 0 else min(max_pages, -(-max_jobs // SEARCH_PAGE_SIZE))
+        search_url = f"https://www.linkedin.com/jobs/search?{urlencode(params)}"
+        first_page = await self._load_search_page(search_url, 0, trace)
+        page_results = [first_page]
+        if len(first_page) >= SEARCH_PAGE_SIZE and pages_needed > 1:
+            rest = await asyncio.gather(
+                *(self._load_search_page(search_url, page_index, trace) for page_index in range(1, pages_needed)),
+                return_exceptions=True,
             )
-            await self._wait_for_cards()
-            await self._scroll_to_reveal_all_cards()
-            cards = await self._extract_cards()
+            for result in rest:
+                if isinstance(result, BaseException):
+                    raise result
+            page_results.extend(rest)
 
+        all_cards: list[dict] = []
+        seen_keys: set[int] = set()
+        for page_index, cards in enumerate(page_results):
             new_on_page = 0
             for card in cards:
                 url = card.get("url", "")
-                if url and url not in seen_urls:
-                    seen_urls.add(url)
+                if not url:
+                    continue
+                key = url_key(url)
+                if key not in seen_keys:
+                    seen_keys.add(key)
                     all_cards.append(card)
                     new_on_page += 1
 
-            logger.info("[LinkedIn] Page %d: %d cards, %d new (total: %d)", page + 1, len(cards), new_on_page, len(all_cards))
-
-            if new_on_page == 0 or len(all_cards) >= max_jobs:
+            logger.info(
+                "[LinkedIn] Page %d: %d cards, %d new (total: %d)",
+                page_index + 1, len(cards), new_on_page, len(all_cards),
+            )
+            if new_on_page == 0 or (max_jobs > 0 and len(all_cards) >= max_jobs):
+                break
+            if len(cards) < SEARCH_PAGE_SIZE:
+                # A short page is the end of the results; anything after it is a stale repeat.
                 break
 
-            if page < max_pages - 1:
-                delay = 1.5 + random.random() * 2.0
-                logger.debug("[LinkedIn] Sleeping %.1fs before next search page", delay)
-                await asyncio.sleep(delay)
-
-        self.diagnostics["cards_found"] = len(all_cards)
-        return all_cards[:max_jobs] if max_jobs > 0 else all_cards
+        all_cards = all_cards[:max_jobs] if max_jobs > 0 else all_cards
+        self.diagnostics["cards_found"] += len(all_cards)
+        if trace is not None:
+            trace["cards_found"] = len(all_cards)
+        return all_cards
+
+    async def _load_search_page(self, search_url: str, page_index: int, trace: dict | None = None) -> list[dict]:
+        if page_index > 0:
+            # Only the offset varies per page, so it is appended to the pre-encoded query.
+            search_url = f"{search_url}&start={page_index * SEARCH_PAGE_SIZE}"
+            # Stagger follow-up pages so they do not hit LinkedIn as one burst.
+            delay = random.uniform(1.5, 3.5) * page_index
+            logger.debug("[LinkedIn] Delaying search page %d by %.1fs", page_index + 1, delay)
+            await asyncio.sleep(delay)
+        async with self._borrow_page() as page:
+            await self._goto(search_url, timeout=45000, page=page, trace=trace)
+            await self._wait_for_cards(page)
+            await self._scroll_to_reveal_all_cards(page)
+            return await self._extract_cards(page)
 
     async def fetch_job_description(self, url: str) -> dict:
         self.diagnostics["last_stage"] = "detail_fetch"
@@ -225,185 +635,166 @@ class LinkedInBrowser:
             return guest_payload
 
         logger.debug("[LinkedIn] Guest API missed, trying logged-in view for %s", url)
-        await self._goto(url, timeout=30000)
+        async with self._borrow_page() as page:
+            return await self._fetch_logged_in_description(page, url)
 
-        for selector in DETAIL_SELECTORS[:3]:
-            try:
-                await self.page.wait_for_selector(selector, timeout=2000)
-                break
-            except Exception:
-                continue
-
-        for btn_selector in (
-            "button[aria-label*='Show more']",
-            "button[aria-label*='See more']",
-            "button.show-more-less-html__button",
-        ):
-            try:
-                btn = await self.page.query_selector(btn_selector)
-                if btn:
-                    await btn.click()
-                    await self.page.wait_for_timeout(500)
-                    break
-            except Exception:
-                continue
+    async def _fetch_logged_in_description(self, page, url: str) -> dict:
+        await self._goto(url, timeout=30000, page=page)
 
         payload = {"json_ld_description": "", "detail_text": "", "detail_html": ""}
-        for selector in DETAIL_SELECTORS:
+        try:
+            payload["json_ld_description"] = await page.evaluate(READ_JOB_POSTING_LD_CALL) or ""
+        except Exception as exc:
+            logger.debug("[LinkedIn] JSON-LD read failed for %s: %s", url, exc)
+        if payload["json_ld_description"]:
+            # The SSR JobPosting already carries the full JD: skip the render wait and "Show more".
+            return payload
+
+        try:
+            # One joined wait resolves on whichever container renders first.
+            await page.wait_for_selector(DETAIL_READY_SELECTOR, state="attached", timeout=6000)
+        except Exception:
+            pass
+
+        try:
+            clicked = await page.evaluate(CLICK_SHOW_MORE_CALL, list(SHOW_MORE_SELECTORS))
+        except Exception:
+            clicked = None
+        if clicked:
             try:
-                element = await self.page.query_selector(selector)
-                if not element:
-                    continue
-                payload["detail_text"] = (await element.inner_text()).strip()
-                payload["detail_html"] = (await element.inner_html()).strip()
-                if payload["detail_text"] or payload["detail_html"]:
-                    return payload
+                # Resolve as soon as the description expands instead of sleeping a fixed 500ms.
+                await page.wait_for_function(SHOW_MORE_EXPANDED_CALL, arg=clicked, timeout=500)
             except Exception:
-                continue
+                pass
+
+        try:
+            content = await page.evaluate(READ_FIRST_CONTENT_CALL, list(DETAIL_SELECTORS))
+        except Exception as exc:
+            logger.debug("[LinkedIn] Detail extraction failed for %s: %s", url, exc)
+            content = {}
+        payload["detail_text"] = content.get("text", "")
+        payload["detail_html"] = content.get("html", "")
+        if payload["detail_text"] or payload["detail_html"]:
+            return payload
 
         self.diagnostics["detail_fetch_failures"] += 1
         logger.warning("[LinkedIn] All methods failed for %s", url)
         return payload
 
     async def _fetch_guest_description(self, url: str) -> dict:
-        """Fetch JD from LinkedIn's public guest API on a separate page (no auth needed)."""
-        payload = {"json_ld_description": "", "detail_text": "", "detail_html": ""}
-        match = re.search(r"/jobs/view/(\d+)", url)
-        if not match:
-            return payload
-        job_id = match.group(1)
-        guest_url = f"https://www.linkedin.com/jobs-guest/jobs/api/jobPosting/{job_id}"
-        guest_page = await self.context.new_page()
+        """Fetch JD from LinkedIn's public guest API over HTTP, sharing the context's cookie jar."""
+        if not guest_posting_url(url):
+            return {"json_ld_description": "", "detail_text": "", "detail_html": ""}
         try:
-            resp = await guest_page.goto(guest_url, wait_until="domcontentloaded", timeout=15000)
-            if not resp or resp.status != 200:
-                return payload
-            for selector in GUEST_DETAIL_SELECTORS:
-                element = await guest_page.query_selector(selector)
-                if not element:
-                    continue
-                payload["detail_text"] = (await element.inner_text()).strip()
-                payload["detail_html"] = (await element.inner_html()).strip()
-                if payload["detail_text"] or payload["detail_html"]:
-                    return payload
+            async with self._guest_slots:
+                payload = await fetch_guest_description(self.context.request, url)
+            self._guest_slots.record_success()
+            return payload
+        except LinkedInRateLimitError:
+            self._guest_slots.record_overload()
+            self.diagnostics["guest_rate_limited"] += 1
+            logger.warning("[LinkedIn] Guest API rate-limited; concurrency cap now %d", self._guest_slots.limit)
+            return {"json_ld_description": "", "detail_text": "", "detail_html": ""}
         except Exception as exc:
             logger.debug("[LinkedIn] Guest API error: %s", exc)
-        finally:
-            await guest_page.close()
-        return payload
+            return {"json_ld_description": "", "detail_text": "", "detail_html": ""}
 
-    async def _goto(self, url: str, *, timeout: int) -> None:
-        self.diagnostics["last_url"] = url
+    def _note(self, trace: dict | None, **fields) -> None:
+        """Record stage/URL on the session diagnostics and, when given, on one query's trace."""
+        self.diagnostics.update(fields)
+        if trace is not None:
+            trace.update(fields)
+
+    async def _goto(self, url: str, *, timeout: int, page=None, trace: dict | None = None) -> None:
+        page = page or self.page
+        self._note(trace, last_url=url)
         try:
-            await self.page.goto(url, wait_until="domcontentloaded", timeout=timeout)
+            async with self._navigation_slots:
+                await page.goto(url, wait_until="domcontentloaded", timeout=timeout)
         except PlaywrightTimeout as exc:
-            self.diagnostics["last_stage"] = "navigation_timeout"
+            self._note(trace, last_stage="navigation_timeout")
             raise LinkedInBrowserError(f"Timed out loading LinkedIn page: {url}") from exc
 
-        self.diagnostics["last_url"] = self.page.url
-        if self._is_auth_url(self.page.url):
+        self._note(trace, last_url=page.url)
+        if self._is_auth_url(page.url):
             self.diagnostics["session_status"] = "auth_redirect"
-            raise LinkedInSessionError(f"LinkedIn redirected to auth page: {self.page.url}")
-        await self._raise_if_challenge_page()
+            raise LinkedInSessionError(f"LinkedIn redirected to auth page: {page.url}")
+        await self._raise_if_challenge_page(page, trace)
 
-    async def _raise_if_challenge_page(self) -> None:
-        self.diagnostics["last_stage"] = "challenge_check"
-        self.diagnostics["last_url"] = self.page.url or self.diagnostics.get("last_url", "")
-        url = (self.page.url or "").lower()
+    async def _raise_if_challenge_page(self, page=None, trace: dict | None = None) -> None:
+        page = page or self.page
+        self._note(trace, last_stage="challenge_check", last_url=page.url or self.diagnostics.get("last_url", ""))
+        url = (page.url or "").lower()
         if any(marker in url for marker in CHALLENGE_URL_MARKERS):
             matched_marker = next(marker for marker in CHALLENGE_URL_MARKERS if marker in url)
             self.diagnostics["session_status"] = "challenge"
             self.diagnostics["challenge_marker"] = f"url:{matched_marker}"
-            logger.warning("[LinkedIn] Challenge URL detected: url=%s", self.page.url)
+            logger.warning("[LinkedIn] Challenge URL detected: url=%s", page.url)
             raise LinkedInCaptchaError("LinkedIn CAPTCHA or challenge page detected")
 
         try:
-            body_text = (await self.page.inner_text("body")).lower()
+            hit = await page.evaluate(FIND_CHALLENGE_MARKER_CALL, list(VISIBLE_CHALLENGE_MARKERS))
         except Exception:
-            body_text = ""
+            hit = None
 
-        for marker in VISIBLE_CHALLENGE_MARKERS:
-            index = body_text.find(marker)
-            if index >= 0:
-                self.diagnostics["session_status"] = "challenge"
-                self.diagnostics["challenge_marker"] = f"text:{marker}"
-                snippet_start = max(0, index - 160)
-                snippet_end = min(len(body_text), index + 160)
-                snippet = body_text[snippet_start:snippet_end].replace("\n", " ")
-                logger.warning(
-                    "[LinkedIn] Visible challenge marker detected: marker=%s url=%s snippet=%s",
-                    marker,
-                    self.page.url,
-                    snippet,
-                )
-                raise LinkedInCaptchaError("LinkedIn CAPTCHA or challenge page detected")
+        if hit:
+            marker = hit.get("marker", "")
+            self.diagnostics["session_status"] = "challenge"
+            self.diagnostics["challenge_marker"] = f"text:{marker}"
+            logger.warning(
+                "[LinkedIn] Visible challenge marker detected: marker=%s url=%s snippet=%s",
+                marker,
+                page.url,
+                hit.get("snippet", ""),
+            )
+            raise LinkedInCaptchaError("LinkedIn CAPTCHA or challenge page detected")
 
     def _is_auth_url(self, url: str) -> bool:
         return any(marker in url for marker in AUTH_MARKERS)
 
-    async def _scroll_to_reveal_all_cards(self) -> None:
-        """Scroll each card into viewport to trigger LinkedIn's occludable DOM lazy-loading."""
-        for selector in SEARCH_CARD_SELECTORS:
-            cards = await self.page.query_selector_all(selector)
-            if not cards:
-                continue
-            for card in cards:
-                try:
-                    await card.scroll_into_view_if_needed(timeout=2000)
-                    await self.page.wait_for_timeout(150)
-                except Exception:
-                    pass
-            break
-
-    async def _wait_for_cards(self) -> None:
-        for selector in SEARCH_CARD_SELECTORS:
-            try:
-                await self.page.wait_for_selector(selector, timeout=5000)
-                return
-            except Exception:
-                continue
+    async def _scroll_to_reveal_all_cards(self, page=None) -> None:
+        """Scroll occluded cards into viewport to trigger LinkedIn's lazy hydration.
 
-    async def _extract_cards(self) -> list[dict]:
-        script = """
-        (selectors) => {
-            const items = [];
-            for (const selector of selectors) {
-                const cards = Array.from(document.querySelectorAll(selector));
-                if (!cards.length) {
-                    continue;
-                }
-                for (const card of cards) {
-                    const titleEl = card.querySelector('.job-card-list__title strong, .job-card-list__title, h3 strong, a[class*="title"]');
-                    const companyEl = card.querySelector('.job-card-container__company-name, .artdeco-entity-lockup__subtitle, .job-card-container__company-link, .job-card-container__primary-description');
-                    const locationEl = card.querySelector('.job-card-container__metadata-item, .artdeco-entity-lockup__caption');
-                    const linkEl = card.querySelector('a[href*="/jobs/view/"]') || card.querySelector('a.job-card-list__title') || card.querySelector('a');
-                    const href = linkEl ? (linkEl.getAttribute('href') || '') : '';
-                    items.push({
-                        title: titleEl ? (titleEl.textContent || '').trim() : '',
-                        company: companyEl ? (companyEl.textContent || '').trim() : '',
-                        location: locationEl ? (locationEl.textContent || '').trim() : '',
-                        url: href,
-                    });
-                }
-                if (items.length) {
-                    break;
-                }
-            }
-            return items;
-        }
+        Runs entirely in-page and repeats only while the card count keeps growing, so an
+        exhausted list ends after one pass and a slow render still gets revealed.
         """
-        cards = await self.page.evaluate(script, list(SEARCH_CARD_SELECTORS))
+        try:
+            revealed = await (page or self.page).evaluate(REVEAL_CARDS_CALL, self._card_selectors())
+        except Exception as exc:
+            logger.debug("[LinkedIn] Card reveal scroll failed: %s", exc)
+            return
+        if isinstance(revealed, dict) and revealed.get("total") and revealed.get("selector"):
+            self._card_selector = revealed["selector"]
+
+    def _card_selectors(self) -> list[str]:
+        return [self._card_selector] if self._card_selector else list(SEARCH_CARD_SELECTORS)
+
+    async def _wait_for_cards(self, page=None) -> None:
+        page = page or self.page
+        try:
+            await page.wait_for_selector(
+                self._card_selector or SEARCH_CARD_SELECTOR, state="attached", timeout=10000
+            )
+        except Exception:
+            logger.debug("[LinkedIn] No search cards appeared on %s", page.url)
+
+    async def _extract_cards(self, page=None) -> list[dict]:
+        page = page or self.page
+        cards = await page.evaluate(EXTRACT_CARDS_CALL, self._card_selectors())
+        if not cards and self._card_selector:
+            # The memoized selector stopped matching (layout change): probe the full list again.
+            self._card_selector = None
+            cards = await page.evaluate(EXTRACT_CARDS_CALL, list(SEARCH_CARD_SELECTORS))
         normalized = []
         for card in cards or []:
-            href = (card.get("url") or "").split("?")[0]
-            if href and not href.startswith("http"):
-                href = f"https://www.linkedin.com{href}"
+            href = canonical_job_url(card.get("url") or "")
             normalized.append(
                 {
                     "title": card.get("title", ""),
                     "company": card.get("company", ""),
                     "location": card.get("location", ""),
                     "url": href,
+                    "posted": card.get("posted", ""),
                 }
             )
         return normalized
@@ -454,13 +845,15 @@ class LinkedInBrowserStub:
         self.diagnostics["last_stage"] = "validate_session"
         return True
 
-    async def search_jobs(self, keywords: str, **kwargs) -> list[dict]:
+    async def search_jobs(self, keywords: str, *, trace: dict | None = None, **kwargs) -> list[dict]:
         self.diagnostics["last_stage"] = "search"
         failure = self.failures_by_query.get(keywords)
         if failure:
             raise failure
         results = list(self.search_results_by_query.get(keywords, []))
-        self.diagnostics["cards_found"] = len(results)
+        self.diagnostics["cards_found"] += len(results)
+        if trace is not None:
+            trace.update(last_stage="search", cards_found=len(results))
         return results
 
     async def fetch_job_description(self, url: str) -> dict:
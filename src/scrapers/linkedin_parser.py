@@ -1,16 +1,27 @@
 import re
+from html.parser import HTMLParser
 
 from src.scrapers.utils import strip_html
 
+VERIFICATION_SUFFIX_RE = re.compile(r"\s*with verification\s*$", re.IGNORECASE)
+DOUBLE_SPACE_RE = re.compile(r"\s{2,}")
+WHITESPACE_RE = re.compile(r"\s+")
+# /jobs/view/<id>, slugged /jobs/view/<title>-<id>, or a ?currentJobId=<id> collection URL.
+JOB_ID_RE = re.compile(r"/jobs/view/(?:[^/?#]*-)?(\d+)|[?&]currentJobId=(\d+)")
+VOID_ELEMENTS = frozenset({
+    "area", "base", "br", "col", "embed", "hr", "img", "input",
+    "link", "meta", "param", "source", "track", "wbr",
+})
+
 
 def clean_title(title: str) -> str:
     if not title:
         return ""
 
     title = title.strip().replace("\n", " ")
-    title = re.sub(r"\s*with verification\s*$", "", title, flags=re.IGNORECASE)
+    title = VERIFICATION_SUFFIX_RE.sub("", title)
 
-    parts = re.split(r"\s{2,}", title)
+    parts = DOUBLE_SPACE_RE.split(title)
     if len(parts) >= 2 and parts[0].strip() == parts[1].strip():
         title = parts[0].strip()
 
@@ -28,7 +39,25 @@ def clean_title(title: str) -> str:
                 title = first
                 break
 
-    return re.sub(r"\s+", " ", title).strip()
+    return WHITESPACE_RE.sub(" ", title).strip()
+
+
+def linkedin_job_id(url: str) -> int | None:
+    match = JOB_ID_RE.search(url or "")
+    if not match:
+        return None
+    return int(match.group(1) or match.group(2))
+
+
+def canonical_job_url(url: str) -> str:
+    """One URL per posting, whichever surface (search, collection, slug, subdomain) linked it."""
+    job_id = linkedin_job_id(url)
+    if job_id is not None:
+        return f"https://www.linkedin.com/jobs/view/{job_id}"
+    url = (url or "").split("#")[0].split("?")[0].rstrip("/")
+    if url and not url.startswith("http"):
+        url = f"https://www.linkedin.com{url}"
+    return url
 
 
 def parse_search_cards(cards: list[dict]) -> list[dict]:
@@ -39,15 +68,17 @@ def parse_search_cards(cards: list[dict]) -> list[dict]:
         url = card.get("url", "").strip()
         if not title or not company or not url:
             continue
-        jobs.append(
-            {
-                "title": title,
-                "company": company,
-                "location": card.get("location", "").strip(),
-                "url": url,
-                "source": "LinkedIn",
-            }
-        )
+        job = {
+            "title": title,
+            "company": company,
+            "location": card.get("location", "").strip(),
+            "url": url,
+            "source": "LinkedIn",
+        }
+        posted = (card.get("posted") or "").strip()
+        if posted:
+            job["posted_date"] = posted
+        jobs.append(job)
     return jobs
 
 
@@ -59,3 +90,88 @@ def extract_job_description(payload: dict) -> str:
         or ""
     )
     return strip_html(description)
+
+
+class _ExtractionDone(Exception):
+    """Raised inside the parser once the top-priority class is captured."""
+
+
+class _ClassContentExtractor(HTMLParser):
+    """Collect the inner HTML of the first element carrying each wanted class (nesting allowed)."""
+
+    def __init__(self, class_names: tuple[str, ...]):
+        super().__init__(convert_charrefs=False)
+        self.class_names = class_names
+        self.found: dict[str, str] = {}
+        self._open: list[list] = []  # [class name, tag, depth, parts] per element being captured
+
+    def _emit(self, text: str) -> None:
+        for capture in self._open:
+            capture[3].append(text)
+
+    def handle_starttag(self, tag, attrs):
+        self._emit(self.get_starttag_text())
+        if tag in VOID_ELEMENTS:
+            return
+        # Only same-name tags move the depth: JD markup routinely drops </p> and </li>.
+        for capture in self._open:
+            if capture[1] == tag:
+                capture[2] += 1
+        classes = (dict(attrs).get("class") or "").split()
+        capturing = {capture[0] for capture in self._open}
+        for name in self.class_names:
+            if name in classes and name not in self.found and name not in capturing:
+                self._open.append([name, tag, 1, []])
+
+    def handle_startendtag(self, tag, attrs):
+        self._emit(self.get_starttag_text())
+
+    def handle_endtag(self, tag):
+        if tag in VOID_ELEMENTS:
+            return
+        still_open = []
+        for capture in self._open:
+            if capture[1] == tag:
+                capture[2] -= 1
+            if capture[2] == 0:
+                self.found[capture[0]] = "".join(capture[3]).strip()
+                if capture[0] == self.class_names[0] and self.found[capture[0]]:
+                    # Nothing later in the document can outrank it: stop tokenizing.
+                    raise _ExtractionDone
+            else:
+                capture[3].append(f"</{tag}>")
+                still_open.append(capture)
+        self._open = still_open
+
+    def close(self):
+        super().close()
+        # Unbalanced markup: keep whatever was captured before the fragment ended.
+        for name, _tag, _depth, parts in self._open:
+            self.found.setdefault(name, "".join(parts).strip())
+        self._open = []
+
+    def handle_data(self, data):
+        self._emit(data)
+
+    def handle_entityref(self, name):
+        self._emit(f"&{name};")
+
+    def handle_charref(self, name):
+        self._emit(f"&#{name};")
+
+
+def extract_first_class_html(html: str, class_names: tuple[str, ...]) -> str:
+    """Inner HTML of the first non-empty element matching ``class_names``, in priority order.
+
+    Lets the guest posting fragment be read over plain HTTP without rendering it in a tab.
+    """
+    extractor = _ClassContentExtractor(class_names)
+    try:
+        extractor.feed(html or "")
+        extractor.close()
+    except _ExtractionDone:
+        pass
+    for name in class_names:
+        if extractor.found.get(name):
+            return extractor.found[name]
+    return ""
@@ -2,20 +2,93 @@ import asyncio
 import html
 import re
 
+try:
+    import uvloop
+    EVENT_LOOP_FACTORY = uvloop.new_event_loop
+except ImportError:
+    EVENT_LOOP_FACTORY = None
+
+# Scrapers only read DOM text; stylesheets stay so visibility checks behave.
+BLOCKED_FILE_EXTENSIONS = (
+    "png", "jpe?g", "gif", "webp", "avif", "svg", "ico",
+    "woff2?", "ttf", "otf", "mp4", "webm", "m3u8",
+)
+BLOCKED_URL_MARKERS = (
+    "media.licdn.com",  # LinkedIn images/video, served without file extensions
+    "/li/track",
+    "px.ads.linkedin.com",
+    "/tscp-serving/",
+    "li.protechts.net",
+    "doubleclick.net",
+    "google-analytics.com",
+    "googletagmanager.com",
+)
+# Registered as the route's URL pattern, so the browser only hands matching requests to
+# Python; everything else continues without a round-trip. Dots are the only metacharacters
+# escaped so the pattern stays valid as a JavaScript RegExp.
+BLOCKED_REQUEST_RE = re.compile(
+    r"\.(?:" + "|".join(BLOCKED_FILE_EXTENSIONS) + r")(?:[?#]|$)|"
+    + "|".join(marker.replace(".", r"\.") for marker in BLOCKED_URL_MARKERS)
+)
+
+
+class AdaptiveLimiter:
+    """AIMD concurrency cap for a rate-limited endpoint.
+
+    ``record_overload`` (e.g. on HTTP 429) halves the cap; every ``limit`` clean
+    responses raise it by one, up to ``maximum``.
+    """
+
+    def __init__(self, initial: int = 2, *, minimum: int = 1, maximum: int = 8):
+        self.minimum = max(1, minimum)
+        self.maximum = max(self.minimum, maximum)
+        self.limit = min(max(initial, self.minimum), self.maximum)
+        self._in_flight = 0
+        self._successes = 0
+        self._slots_changed = asyncio.Condition()
+
+    async def __aenter__(self):
+        async with self._slots_changed:
+            await self._slots_changed.wait_for(lambda: self._in_flight < self.limit)
+            self._in_flight += 1
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        async with self._slots_changed:
+            self._in_flight -= 1
+            self._slots_changed.notify_all()
+
+    def record_success(self) -> None:
+        self._successes += 1
+        if self._successes >= self.limit and self.limit < self.maximum:
+            self.limit += 1
+            self._successes = 0
+
+    def record_overload(self) -> None:
+        self.limit = max(self.minimum, self.limit // 2)
+        self._successes = 0
+
+
+_BR_RE = re.compile(r"<br\s*/?>")
+_BLOCK_OPEN_RE = re.compile(r"<(?:p|tr|div|h[1-6])[^>]*>", re.IGNORECASE)
+_LI_OPEN_RE = re.compile(r"<li[^>]*>", re.IGNORECASE)
+_TAG_RE = re.compile(r"<[^>]+>")
+_SPACE_RUN_RE = re.compile(r" {2,}")
+
 
 def strip_html(text: str) -> str:
     """Strip HTML tags, decode entities, collapse whitespace."""
-    text = re.sub(r"<br\s*/?>", "\n", text)
-    text = re.sub(r"<(?:p|tr|div|h[1-6])[^>]*>", "\n", text, flags=re.IGNORECASE)
-    text = re.sub(r"<li[^>]*>", "\n- ", text, flags=re.IGNORECASE)
-    text = re.sub(r"<[^>]+>", " ", text)
+    text = _BR_RE.sub("\n", text)
+    text = _BLOCK_OPEN_RE.sub("\n", text)
+    text = _LI_OPEN_RE.sub("\n- ", text)
+    text = _TAG_RE.sub(" ", text)
     text = html.unescape(text)
-    text = re.sub(r" {2,}", " ", text)
+    text = _SPACE_RUN_RE.sub(" ", text)
     return text.strip()
 
 
 def run_async(coro):
-    """Run an async coroutine from sync code, handling nested event loops."""
+    """Run an async coroutine from sync code, handling nested event loops (uvloop if installed)."""
     try:
         loop = asyncio.get_running_loop()
     except RuntimeError:
@@ -25,5 +98,20 @@ def run_async(coro):
         import concurrent.futures
 
         with concurrent.futures.ThreadPoolExecutor(max_workers=1) as pool:
-            return pool.submit(asyncio.run, coro).result()
-    return asyncio.run(coro)
+            return pool.submit(_run_on_new_loop, coro).result()
+    return _run_on_new_loop(coro)
+
+
+def _run_on_new_loop(coro):
+    # uvloop (libuv) when installed; otherwise the default asyncio loop.
+    with asyncio.Runner(loop_factory=EVENT_LOOP_FACTORY) as runner:
+        return runner.run(coro)
+
+
+async def abort_route(route) -> None:
+    await route.abort()
+
+
+async def install_resource_blocking(target) -> None:
+    """Abort images, fonts, media and tracking beacons on a Playwright context or page."""
+    await target.route(BLOCKED_REQUEST_RE, abort_route)
@@ -726,3 +726,12 @@ class TestJobAnalysisDB:
         assert len(jobs) == 1
         assert jobs[0]["application_status"] == "applied"
         assert jobs[0]["application_date"] == "2026-03-28"
+
+
+def test_infer_role_types_matches_overlapping_keywords_in_fixed_order():
+    from src.ai_analyzer import infer_role_types
+
+    assert infer_role_types("Senior Data Engineer / ML Engineer") == ["ml_engineer", "data_engineer"]
+    assert infer_role_types("AI/ML Platform Engineer") == ["ml_engineer", "ai_engineer"]
+    assert infer_role_types("Research Scientist, Artificial Intelligence") == ["ai_engineer", "data_scientist"]
+    assert infer_role_types("Backend Developer") == []
@@ -1,6 +1,6 @@
 import json
 
-from src.cover_letter_generator import get_resume_context_for_cl
+from src.cover_letter_generator import CoverLetterGenerator, get_resume_context_for_cl
 from src.template_registry import load_registry
 
 
@@ -30,3 +30,13 @@ def test_get_resume_context_for_cl_legacy_keeps_existing_behavior():
     context = get_resume_context_for_cl(row, registry)
 
     assert context.startswith('{"bio": "Legacy bio"}')
+
+
+def test_infer_role_types_collects_every_matching_category():
+    generator = CoverLetterGenerator.__new__(CoverLetterGenerator)
+
+    assert sorted(generator._infer_role_types({"title": "Quantitative Data Analyst"}, {})) == ["data_analyst", "quant"]
+    assert sorted(generator._infer_role_types({"title": "Senior Data Engineer - Spark"}, {})) == ["data_engineer"]
+    assert sorted(generator._infer_role_types({"title": "Backend Developer"}, {})) == [
+        "data_engineer", "data_scientist", "ml_engineer",
+    ]
@@ -1,8 +1,10 @@
 """Tests for cross-platform semantic dedup during import."""
 import os
 import sqlite3
+import threading
 from contextlib import contextmanager
 from datetime import datetime, timedelta
+from pathlib import Path
 
 from src.db.job_db import JobDatabase
 
@@ -501,3 +503,93 @@ class TestResurfacedJobPipeline:
         match = [j for j in jobs if j["id"] == job_id]
         assert len(match) == 1
         assert match[0]["application_status"] == "applied"
+
+
+def test_semantic_dedup_lookup_uses_lower_company_index():
+    """find_semantic_duplicate filters on LOWER(company); the schema must index that expression."""
+    conn = sqlite3.connect(":memory:")
+    for statement in JobDatabase.SCHEMA.split(';'):
+        if statement.strip():
+            conn.execute(statement)
+
+    plan = conn.execute(
+        "EXPLAIN QUERY PLAN SELECT id, title FROM jobs WHERE LOWER(company) = ?", ("acme",)
+    ).fetchall()
+
+    assert any("idx_jobs_company_lower" in row[-1] for row in plan)
+
+
+def test_insert_jobs_shares_one_connection(monkeypatch):
+    """A scraped batch is written through one SQLite connection and transaction."""
+    monkeypatch.setenv("DB_TRANSPORT", "sqlite")
+    db_path = Path(__file__).resolve().parent / "insert_jobs_test.db"
+    try:
+        db = JobDatabase(db_path=db_path)
+        real_connect = sqlite3.connect
+        connects = []
+
+        def counting_connect(*args, **kwargs):
+            connects.append(args)
+            return real_connect(*args, **kwargs)
+
+        monkeypatch.setattr("src.db.job_db.sqlite3.connect", counting_connect)
+        results = db.insert_jobs([
+            {"url": "http://a.com/1", "title": "Data Engineer", "company": "Acme", "source": "test"},
+            {"url": "http://b.com/2", "title": "Data Engineer", "company": "Acme", "source": "test"},
+            {"url": "http://c.com/3", "title": "ML Engineer", "company": "Beta", "source": "test"},
+        ])
+
+        assert [inserted for _, inserted in results] == [True, False, True]
+        assert len(connects) == 1
+        assert db._shared_conn is None
+        assert db.job_exists("http://c.com/3")
+    finally:
+        for suffix in ("", "-wal", "-shm"):
+            Path(str(db_path) + suffix).unlink(missing_ok=True)
+
+
+def test_sqlite_connections_use_wal_with_normal_sync(monkeypatch):
+    monkeypatch.setenv("DB_TRANSPORT", "sqlite")
+    db_path = Path(__file__).resolve().parent / "pragma_test.db"
+    try:
+        db = JobDatabase(db_path=db_path)
+        with db._get_conn() as conn:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+            assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+    finally:
+        for suffix in ("", "-wal", "-shm"):
+            Path(str(db_path) + suffix).unlink(missing_ok=True)
+
+
+def test_concurrent_initialization_tolerates_racing_migrations(monkeypatch):
+    """Several threads opening an out-of-date DB at once must not trip over each other's ALTERs."""
+    monkeypatch.setenv("DB_TRANSPORT", "sqlite")
+    db_path = Path(__file__).resolve().parent / "concurrent_init_test.db"
+    try:
+        JobDatabase(db_path=db_path)
+        with sqlite3.connect(str(db_path)) as conn:
+            conn.execute("ALTER TABLE jobs DROP COLUMN manual_source")
+
+        barrier = threading.Barrier(3, timeout=5)
+        errors = []
+
+        def open_db():
+            barrier.wait()
+            try:
+                JobDatabase(db_path=db_path)
+            except Exception as exc:
+                errors.append(exc)
+
+        threads = [threading.Thread(target=open_db) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        with sqlite3.connect(str(db_path)) as conn:
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(jobs)")}
+        assert "manual_source" in columns
+    finally:
+        for suffix in ("", "-wal", "-shm"):
+            Path(str(db_path) + suffix).unlink(missing_ok=True)
@@ -0,0 +1,90 @@
+"""Tests for JobDatabase JSON / NDJSON export and import."""
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from tests.test_dedup import _make_test_db
+
+
+def _seed(db, count: int) -> None:
+    for i in range(count):
+        db.insert_job({
+            "url": f"https://example.com/jobs/{i}",
+            "title": f"Data Engineer {i}",
+            "company": f"Company {i}",
+            "source": "greenhouse",
+            "search_profile": "data_engineering",
+        })
+
+
+def test_export_to_ndjson_streams_one_job_per_line():
+    db = _make_test_db()
+    _seed(db, 3)
+    output_path = Path(__file__).resolve().parent / "export_test.jsonl"
+    try:
+        count = db.export_to_json(output_path, profile="data_engineering")
+
+        lines = output_path.read_text(encoding="utf-8").splitlines()
+        assert count == 3
+        assert [json.loads(line)["company"] for line in lines] == ["Company 0", "Company 1", "Company 2"]
+        assert not output_path.with_name(output_path.name + ".tmp").exists()
+    finally:
+        output_path.unlink(missing_ok=True)
+
+
+def test_export_to_ndjson_removes_temp_file_when_a_write_fails():
+    db = _make_test_db()
+    _seed(db, 3)
+    output_path = Path(__file__).resolve().parent / "export_fail_test.jsonl"
+    try:
+        with patch("src.db.job_db.orjson.dumps", side_effect=[b"{}\n", TypeError("boom")]):
+            with pytest.raises(TypeError):
+                db.export_to_json(output_path)
+
+        assert not output_path.exists()
+        assert not output_path.with_name(output_path.name + ".tmp").exists()
+    finally:
+        output_path.unlink(missing_ok=True)
+
+
+def test_export_to_json_writes_indented_utf8_document():
+    db = _make_test_db()
+    db.insert_job({
+        "url": "https://example.com/jobs/zurich",
+        "title": "Datenanalyst",
+        "company": "Zürich Versicherung",
+        "source": "greenhouse",
+        "search_profile": "data_engineering",
+    })
+    output_path = Path(__file__).resolve().parent / "export_test.json"
+    try:
+        count = db.export_to_json(output_path)
+
+        text = output_path.read_text(encoding="utf-8")
+        assert count == 1
+        assert "Zürich Versicherung" in text
+        assert text.startswith('{\n  "jobs"')
+        assert json.loads(text)["jobs"][0]["title"] == "Datenanalyst"
+    finally:
+        output_path.unlink(missing_ok=True)
+
+
+def test_import_from_ndjson_round_trips_an_export():
+    source = _make_test_db()
+    _seed(source, 2)
+    target = _make_test_db()
+    path = Path(__file__).resolve().parent / "import_test.jsonl"
+    try:
+        source.export_to_json(path)
+        path.write_bytes(path.read_bytes() + b"\n")  # trailing blank line is tolerated
+
+        imported = target.import_from_json(path, profile="data_engineering")
+
+        assert imported == 2
+        assert target.find_existing_job_ids(
+            ["https://example.com/jobs/0", "https://example.com/jobs/1"]
+        ) == {target.generate_job_id("https://example.com/jobs/0"), target.generate_job_id("https://example.com/jobs/1")}
+    finally:
+        path.unlink(missing_ok=True)
@@ -0,0 +1,25 @@
+"""Tests for the shared keyword -> category matcher."""
+import pytest
+
+from src.keyword_matcher import compile_keyword_matcher
+
+
+def test_matcher_reports_every_category_including_overlapping_keywords():
+    match = compile_keyword_matcher({
+        'ml': ('ml engineer',),
+        'de': ('engineering manager', 'data'),
+    })
+
+    assert match('senior ml engineering manager') == {'ml', 'de'}
+    assert match('data platform') == {'de'}
+    assert match('product owner') == set()
+
+
+@pytest.mark.parametrize('table', [
+    {'a': ('data',), 'b': ('data engineer',)},
+    {'a': ('data engineer',), 'b': ('data',)},
+    {'a': ('quant',), 'b': ('quant',)},
+])
+def test_matcher_rejects_keywords_that_would_hide_another_category(table):
+    with pytest.raises(ValueError):
+        compile_keyword_matcher(table)
@@ -0,0 +1,73 @@
+"""Tests for the shared Playwright HTML -> PDF helper."""
+import asyncio
+import threading
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from src import pdf_renderer
+
+
+def test_html_to_pdf_reuses_one_browser_until_shutdown():
+    playwright = MagicMock()
+    browser = playwright.chromium.launch.return_value
+    browser.is_connected.return_value = True
+    with patch("playwright.sync_api.sync_playwright") as sync_playwright:
+        sync_playwright.return_value.start.return_value = playwright
+        try:
+            for name in ("a", "b", "c"):
+                pdf_renderer.html_to_pdf(Path(f"/tmp/{name}.html"), Path(f"/tmp/{name}.pdf"), format="A4")
+
+            playwright.chromium.launch.assert_called_once()
+            assert browser.new_page.call_count == 3
+            assert browser.new_page.return_value.close.call_count == 3
+            page = browser.new_page.return_value
+            assert page.goto.call_args.kwargs["wait_until"] == "load"
+            assert "document.fonts.ready" in page.evaluate.call_args.args[0]
+        finally:
+            pdf_renderer.shutdown_browser()
+
+    browser.close.assert_called_once()
+    playwright.stop.assert_called_once()
+    assert pdf_renderer._browser is None
+
+
+def test_preload_browser_relaunches_after_a_disconnect():
+    playwright = MagicMock()
+    dead, fresh = MagicMock(), MagicMock()
+    dead.is_connected.return_value = False
+    playwright.chromium.launch.side_effect = [dead, fresh]
+    with patch("playwright.sync_api.sync_playwright") as sync_playwright:
+        sync_playwright.return_value.start.return_value = playwright
+        try:
+            pdf_renderer.preload_browser()
+            assert pdf_renderer._browser is dead
+            pdf_renderer.preload_browser()
+            assert pdf_renderer._browser is fresh
+        finally:
+            pdf_renderer.shutdown_browser()
+
+
+def test_playwright_runs_off_the_calling_thread_so_asyncio_run_still_works():
+    playwright = MagicMock()
+    launch_threads = []
+    playwright.chromium.launch.side_effect = lambda: launch_threads.append(threading.get_ident()) or MagicMock()
+    with patch("playwright.sync_api.sync_playwright") as sync_playwright:
+        sync_playwright.return_value.start.return_value = playwright
+        try:
+            pdf_renderer.html_to_pdf(Path("/tmp/a.html"), Path("/tmp/a.pdf"))
+        finally:
+            pdf_renderer.shutdown_browser()
+
+    assert launch_threads and launch_threads[0] != threading.get_ident()
+    assert asyncio.run(asyncio.sleep(0, result="ok")) == "ok"
+
+
+def test_preload_browser_leaves_launch_failures_to_the_first_render():
+    playwright = MagicMock()
+    playwright.chromium.launch.side_effect = RuntimeError("chromium missing")
+    with patch("playwright.sync_api.sync_playwright") as sync_playwright:
+        sync_playwright.return_value.start.return_value = playwright
+        assert pdf_renderer.preload_browser() is None
+
+    assert pdf_renderer._browser is None
+    playwright.stop.assert_called_once()
@@ -128,3 +128,17 @@ def test_run_prefetches_existing_job_ids_for_duplicate_checks(mock_db_cls, mock_
         [url_existing, url_new], since_days=scraper.dedup_window_days,
     )
     db.job_exists.assert_not_called()
+
+
+@patch(
+    "src.scrapers.base.load_blacklists",
+    return_value={"company": [], "title": ["(m/w/d)", "c++"]},
+)
+@patch("src.scrapers.base.JobDatabase")
+def test_blacklist_terms_match_literally(mock_db_cls, mock_blacklists):
+    scraper = DummyScraper()
+
+    assert scraper.is_blacklisted({"company": "Acme", "title": "Data Engineer (m/w/d)"})
+    assert scraper.is_blacklisted({"company": "Acme", "title": "C++ Developer"})
+    assert not scraper.is_blacklisted({"company": "Acme", "title": "Data Engineer m/w/d"})
+    assert not scraper.is_blacklisted({"company": "Anything", "title": "C Developer"})
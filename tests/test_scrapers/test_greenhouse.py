@@ -1,3 +1,6 @@
+import threading
+
+import orjson
 import pytest
 from unittest.mock import patch, MagicMock
 from src.scrapers.greenhouse import GreenhouseScraper
@@ -28,11 +31,11 @@ MOCK_RESPONSE = {
 
 @patch("src.scrapers.base.JobDatabase")
 @patch("src.scrapers.base.load_blacklists", return_value={"company": [], "title": []})
-@patch("src.scrapers.greenhouse.requests.get")
+@patch("src.scrapers.greenhouse.requests.Session.get")
 def test_scrape_with_location_filter(mock_get, mock_bl, mock_db):
     mock_resp = MagicMock()
     mock_resp.status_code = 200
-    mock_resp.json.return_value = MOCK_RESPONSE
+    mock_resp.content = orjson.dumps(MOCK_RESPONSE)
     mock_resp.raise_for_status = MagicMock()
     mock_get.return_value = mock_resp
 
@@ -49,11 +52,11 @@ def test_scrape_with_location_filter(mock_get, mock_bl, mock_db):
 
 @patch("src.scrapers.base.JobDatabase")
 @patch("src.scrapers.base.load_blacklists", return_value={"company": [], "title": []})
-@patch("src.scrapers.greenhouse.requests.get")
+@patch("src.scrapers.greenhouse.requests.Session.get")
 def test_scrape_no_location_filter(mock_get, mock_bl, mock_db):
     mock_resp = MagicMock()
     mock_resp.status_code = 200
-    mock_resp.json.return_value = MOCK_RESPONSE
+    mock_resp.content = orjson.dumps(MOCK_RESPONSE)
     mock_resp.raise_for_status = MagicMock()
     mock_get.return_value = mock_resp
 
@@ -66,7 +69,7 @@ def test_scrape_no_location_filter(mock_get, mock_bl, mock_db):
 
 @patch("src.scrapers.base.JobDatabase")
 @patch("src.scrapers.base.load_blacklists", return_value={"company": [], "title": []})
-@patch("src.scrapers.greenhouse.requests.get")
+@patch("src.scrapers.greenhouse.requests.Session.get")
 def test_scrape_skips_non_greenhouse(mock_get, mock_bl, mock_db):
     company = {"name": "Acme", "ats": "icims", "board_token": "acme"}
     scraper = GreenhouseScraper(companies=[company])
@@ -78,7 +81,7 @@ def test_scrape_skips_non_greenhouse(mock_get, mock_bl, mock_db):
 
 @patch("src.scrapers.base.JobDatabase")
 @patch("src.scrapers.base.load_blacklists", return_value={"company": [], "title": []})
-@patch("src.scrapers.greenhouse.requests.get")
+@patch("src.scrapers.greenhouse.requests.Session.get")
 def test_scrape_handles_api_error(mock_get, mock_bl, mock_db):
     mock_get.side_effect = Exception("Connection timeout")
 
@@ -97,8 +100,11 @@ def test_run_tracks_per_board_target_counts_and_partial_failure(mock_fetch_jobs,
     db.job_exists.return_value = False
     mock_db_cls.return_value = db
 
-    mock_fetch_jobs.side_effect = [
-        [
+    def fetch_jobs(board_token):
+        # Boards are fetched concurrently, so answer by token rather than call order.
+        if board_token == "beta":
+            raise Exception("Connection timeout")
+        return [
             {
                 "id": 123,
                 "title": "Data Engineer",
@@ -107,9 +113,9 @@ def test_run_tracks_per_board_target_counts_and_partial_failure(mock_fetch_jobs,
                 "updated_at": "2026-02-20T10:00:00-05:00",
                 "content": "<p>Build data pipelines...</p>",
             }
-        ],
-        Exception("Connection timeout"),
-    ]
+        ]
+
+    mock_fetch_jobs.side_effect = fetch_jobs
 
     scraper = GreenhouseScraper(
         companies=[
@@ -128,13 +134,11 @@ def test_run_tracks_per_board_target_counts_and_partial_failure(mock_fetch_jobs,
 
 @patch("src.scrapers.base.load_blacklists", return_value={"company": [], "title": []})
 @patch("src.scrapers.base.JobDatabase")
-@patch("src.scrapers.greenhouse.requests.get")
+@patch("src.scrapers.greenhouse.requests.Session.get")
 def test_run_deduplicates_and_persists_new_jobs(mock_get, mock_db_cls, mock_bl):
     db = MagicMock()
     db.job_exists.return_value = False
-    db.batch_mode.return_value.__enter__.return_value = db
-    db.batch_mode.return_value.__exit__.return_value = False
-    db.insert_job.return_value = ("abc123", True)
+    db.insert_jobs.return_value = [("abc123", True)]
     mock_db_cls.return_value = db
 
     duplicate_response = {
@@ -160,7 +164,7 @@ def test_run_deduplicates_and_persists_new_jobs(mock_get, mock_db_cls, mock_bl):
     }
     mock_resp = MagicMock()
     mock_resp.status_code = 200
-    mock_resp.json.return_value = duplicate_response
+    mock_resp.content = orjson.dumps(duplicate_response)
     mock_resp.raise_for_status = MagicMock()
     mock_get.return_value = mock_resp
 
@@ -171,7 +175,8 @@ def test_run_deduplicates_and_persists_new_jobs(mock_get, mock_db_cls, mock_bl):
     assert report.would_insert == 1
     assert report.new == 1
     assert report.skipped_duplicates == 1
-    db.insert_job.assert_called_once()
+    db.insert_jobs.assert_called_once()
+    assert len(db.insert_jobs.call_args.args[0]) == 1
 
 
 def test_html_to_text():
@@ -180,3 +185,42 @@ def test_html_to_text():
     assert "Hello & world" in text
     assert "- item one" in text
     assert "<" not in text
+
+
+@patch("src.scrapers.base.JobDatabase")
+@patch("src.scrapers.base.load_blacklists", return_value={"company": [], "title": []})
+@patch("src.scrapers.greenhouse.time.sleep")
+@patch("src.scrapers.greenhouse.requests.Session.get")
+def test_fetch_jobs_waits_out_rate_limit_on_shared_session(mock_get, mock_sleep, mock_bl, mock_db):
+    limited = MagicMock(status_code=429, headers={"Retry-After": "3"})
+    ok = MagicMock(status_code=200)
+    ok.content = orjson.dumps(MOCK_RESPONSE)
+    mock_get.side_effect = [limited, ok]
+
+    scraper = GreenhouseScraper(companies=[])
+    jobs = scraper._fetch_jobs("acme")
+
+    assert len(jobs) == 2
+    assert mock_get.call_count == 2
+    mock_sleep.assert_called_once_with(3.0)
+
+
+@patch("src.scrapers.base.JobDatabase")
+@patch("src.scrapers.base.load_blacklists", return_value={"company": [], "title": []})
+@patch("src.scrapers.greenhouse.time.sleep")
+def test_scrape_fetches_boards_concurrently_and_keeps_config_order(mock_sleep, mock_bl, mock_db):
+    barrier = threading.Barrier(2, timeout=5)
+
+    def fetch_jobs(board_token):
+        barrier.wait()  # Times out unless both boards are in flight together
+        return [{"title": f"{board_token} engineer", "location": {"name": "Amsterdam"},
+                 "absolute_url": f"https://boards.greenhouse.io/{board_token}/jobs/1"}]
+
+    scraper = GreenhouseScraper(companies=[
+        {"name": "Acme", "ats": "greenhouse", "board_token": "acme"},
+        {"name": "Beta", "ats": "greenhouse", "board_token": "beta"},
+    ])
+    with patch.object(scraper, "_fetch_jobs", side_effect=fetch_jobs):
+        jobs = scraper.scrape()
+
+    assert [job["company"] for job in jobs] == ["Acme", "Beta"]
@@ -78,8 +78,10 @@ def test_run_tracks_query_target_counts_and_timeout_failures(mock_db_cls, mock_b
         ]
     )
     fake_page = MagicMock()
+    fake_page.close = AsyncMock()
     fake_context = MagicMock()
     fake_context.new_page = AsyncMock(return_value=fake_page)
+    fake_context.route = AsyncMock()
     fake_browser = MagicMock()
     fake_browser.new_context = AsyncMock(return_value=fake_context)
     fake_browser.close = AsyncMock()
@@ -133,8 +135,10 @@ def test_scrape_listing_page_returns_empty_quickly_when_no_cards_appear(mock_db_
     jobs = asyncio.run(scraper._scrape_listing_page(page, "https://example.com"))
 
     assert jobs == []
-    page.wait_for_timeout.assert_awaited_once_with(1000)
-    page.wait_for_selector.assert_awaited_once_with("a[href*='/career/jobs-netherlands/']", timeout=4000)
+    page.wait_for_timeout.assert_not_awaited()
+    page.wait_for_selector.assert_awaited_once_with(
+        "a[href*='/career/jobs-netherlands/']", state="attached", timeout=5000
+    )
 
 
 @patch("src.scrapers.base.load_blacklists", return_value={"company": [], "title": []})
@@ -176,3 +180,96 @@ def test_scrape_query_skips_detail_fetch_for_known_duplicates(mock_db_cls, mock_
     )
     db.job_exists.assert_not_called()
     mock_detail.assert_not_awaited()
+
+
+@patch("src.scrapers.base.load_blacklists", return_value={"company": [], "title": []})
+@patch("src.scrapers.base.JobDatabase")
+def test_scrape_async_runs_queries_concurrently_up_to_limit(mock_db_cls, mock_bl):
+    mock_db_cls.return_value = MagicMock()
+    scraper = IamExpatScraper(
+        queries=[{"keywords": "data engineer"}, {"keywords": "ml engineer"}, {"keywords": "mlops"}],
+        query_concurrency=2,
+    )
+    fake_page = MagicMock()
+    fake_page.close = AsyncMock()
+    fake_context = MagicMock()
+    fake_context.new_page = AsyncMock(return_value=fake_page)
+    fake_context.route = AsyncMock()
+    fake_browser = MagicMock()
+    fake_browser.new_context = AsyncMock(return_value=fake_context)
+    fake_browser.close = AsyncMock()
+    fake_playwright = MagicMock()
+    fake_playwright.chromium.launch = AsyncMock(return_value=fake_browser)
+    fake_playwright_cm = MagicMock()
+    fake_playwright_cm.__aenter__ = AsyncMock(return_value=fake_playwright)
+    fake_playwright_cm.__aexit__ = AsyncMock(return_value=False)
+
+    in_flight = 0
+    peak = 0
+
+    async def fake_scrape_query(context, page, query_cfg, seen_urls, detail_semaphore=None):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return [{"title": query_cfg["keywords"]}]
+
+    with patch.object(scraper, "_scrape_query", side_effect=fake_scrape_query), \
+            patch("src.scrapers.iamexpat.async_playwright", return_value=fake_playwright_cm):
+        jobs = asyncio.run(scraper._scrape_async())
+
+    assert [job["title"] for job in jobs] == ["data engineer", "ml engineer", "mlops"]
+    assert peak == 2
+    fake_context.route.assert_awaited_once()
+    assert fake_page.close.await_count == 3
+
+
+@patch("src.scrapers.base.load_blacklists", return_value={"company": [], "title": []})
+@patch("src.scrapers.base.JobDatabase")
+def test_scrape_listing_page_reads_all_cards_in_one_call(mock_db_cls, mock_bl):
+    mock_db_cls.return_value = MagicMock()
+    scraper = IamExpatScraper(queries=[{"keywords": "data engineer"}])
+    detail_href = "/career/jobs-netherlands/it-technology/acme/data-engineer/123"
+    locator = MagicMock()
+    locator.evaluate_all = AsyncMock(
+        return_value=[
+            {"href": detail_href, "text": "Data Engineer\nAcme\nAmsterdam"},
+            {"href": detail_href, "text": "Data Engineer\nAcme\nAmsterdam"},
+            {"href": "/career/jobs-netherlands", "text": "All jobs"},
+        ]
+    )
+    page = MagicMock()
+    page.goto = AsyncMock()
+    page.wait_for_selector = AsyncMock()
+    page.locator = MagicMock(return_value=locator)
+
+    jobs = asyncio.run(scraper._scrape_listing_page(page, "https://example.com"))
+
+    assert jobs == [
+        {
+            "title": "Data Engineer",
+            "company": "Acme",
+            "location": "Amsterdam",
+            "url": f"https://www.iamexpat.nl{detail_href}",
+        }
+    ]
+    locator.evaluate_all.assert_awaited_once()
+
+
+@patch("src.scrapers.base.load_blacklists", return_value={"company": [], "title": []})
+@patch("src.scrapers.base.JobDatabase")
+def test_scrape_detail_page_reads_description_in_one_call(mock_db_cls, mock_bl):
+    mock_db_cls.return_value = MagicMock()
+    scraper = IamExpatScraper(queries=[{"keywords": "data engineer"}])
+    page = MagicMock()
+    page.goto = AsyncMock()
+    page.wait_for_selector = AsyncMock()
+    page.evaluate = AsyncMock(return_value="Build pipelines")
+    page.query_selector = AsyncMock()
+
+    desc = asyncio.run(scraper._scrape_detail_page(page, "https://example.com/job"))
+
+    assert desc == "Build pipelines"
+    page.evaluate.assert_awaited_once()
+    page.query_selector.assert_not_awaited()
@@ -1,8 +1,19 @@
 import asyncio
+import json
+import os
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from src.scrapers.linkedin_browser import LinkedInBrowser, LinkedInCaptchaError
+from src.scrapers.linkedin_browser import (
+    PAGE_HELPERS_SCRIPT,
+    LinkedInBrowser,
+    LinkedInCaptchaError,
+    LinkedInSessionError,
+    url_key,
+)
+from src.scrapers.utils import install_resource_blocking
 
 
 class FakePage:
@@ -19,6 +30,14 @@ class FakePage:
             raise ValueError(selector)
         return self._body_text
 
+    async def evaluate(self, script: str, markers: list[str]):
+        # Mirrors window.__jhFindChallengeMarker: only a hit comes back from the page.
+        text = self._body_text.lower()
+        for marker in markers:
+            if marker in text:
+                return {"marker": marker, "snippet": text}
+        return None
+
 
 def test_challenge_detection_ignores_grecaptcha_script_references():
     browser = LinkedInBrowser()
@@ -46,3 +65,471 @@ def test_challenge_detection_raises_on_visible_security_check_text():
     assert browser.diagnostics["last_stage"] == "challenge_check"
     assert browser.diagnostics["last_url"] == "https://www.linkedin.com/checkpoint/challenge/"
     assert browser.diagnostics["challenge_marker"] == "url:/checkpoint/challenge"
+
+
+def test_challenge_detection_reports_visible_marker_found_in_page():
+    browser = LinkedInBrowser()
+    browser.page = FakePage(
+        url="https://www.linkedin.com/jobs/search?keywords=data",
+        content="",
+        body_text="Let's do a quick security check",
+    )
+
+    with pytest.raises(LinkedInCaptchaError):
+        asyncio.run(browser._raise_if_challenge_page())
+
+    assert browser.diagnostics["challenge_marker"] == "text:security check"
+
+
+def write_cookies_file() -> Path:
+    cookies_path = Path(__file__).resolve().parent / "linkedin_test_cookies.json"
+    cookies_path.write_text(
+        json.dumps([{"name": "li_at", "value": "token", "domain": ".linkedin.com", "path": "/"}]),
+        encoding="utf-8",
+    )
+    return cookies_path
+
+
+def make_context() -> MagicMock:
+    context = MagicMock()
+    context.add_cookies = AsyncMock()
+    context.route = AsyncMock()
+    context.add_init_script = AsyncMock()
+    context.new_page = AsyncMock(return_value=MagicMock())
+    context.close = AsyncMock()
+    return context
+
+
+def make_launch_stub(context: MagicMock) -> tuple[MagicMock, MagicMock]:
+    """async_playwright() double whose launched Chromium hands out ``context``."""
+    launched = MagicMock()
+    launched.new_context = AsyncMock(return_value=context)
+    launched.close = AsyncMock()
+    playwright = MagicMock()
+    playwright.chromium.launch = AsyncMock(return_value=launched)
+    playwright.stop = AsyncMock()
+    starter = MagicMock()
+    starter.start = AsyncMock(return_value=playwright)
+    return starter, launched
+
+
+def test_launched_session_seeds_its_context_from_cookie_file():
+    cookies_path = write_cookies_file()
+    try:
+        context = make_context()
+        starter, launched = make_launch_stub(context)
+
+        async def run():
+            with patch("src.scrapers.linkedin_browser.async_playwright", return_value=starter):
+                async with LinkedInBrowser(cookies_path=cookies_path) as browser:
+                    assert browser.diagnostics["cookies_loaded"] == 1
+
+        asyncio.run(run())
+
+        assert "storage_state" not in launched.new_context.await_args.kwargs
+        context.add_init_script.assert_awaited_once_with(PAGE_HELPERS_SCRIPT)
+        context.set_default_timeout.assert_called_once_with(2000)
+        context.add_cookies.assert_awaited_once()
+        launched.close.assert_awaited_once()
+    finally:
+        cookies_path.unlink(missing_ok=True)
+
+
+def test_resource_blocking_pattern_aborts_images_and_trackers_only():
+    context = MagicMock()
+    context.route = AsyncMock()
+    asyncio.run(install_resource_blocking(context))
+    pattern, handler = context.route.await_args.args
+
+    assert pattern.search("https://media.licdn.com/dms/image/C4D03AQ/profile-displayphoto")
+    assert pattern.search("https://static.licdn.com/aero-v1/sc/h/font.woff2?v=3")
+    assert pattern.search("https://www.linkedin.com/li/track")
+    assert not pattern.search("https://www.linkedin.com/jobs/search?keywords=data")
+    assert not pattern.search("https://static.licdn.com/aero-v1/sc/h/app.js")
+    assert not pattern.search("https://static.licdn.com/aero-v1/sc/h/app.css")
+
+    route = MagicMock()
+    route.abort = AsyncMock()
+    asyncio.run(handler(route))
+    route.abort.assert_awaited_once()
+
+
+def test_persist_storage_state_rewrites_file_only_when_state_changes():
+    cookies_path = write_cookies_file()
+    browser = LinkedInBrowser(cookies_path=cookies_path)
+    try:
+        rotated = [{"name": "li_at", "value": "rotated", "domain": ".linkedin.com", "path": "/"}]
+        browser.context = MagicMock()
+        browser.context.storage_state = AsyncMock(
+            side_effect=lambda: {
+                "cookies": rotated + [{"name": "other", "value": "x", "domain": ".example.com", "path": "/"}],
+                "origins": [],
+            }
+        )
+        browser.diagnostics["session_status"] = "ok"
+
+        assert asyncio.run(browser._persist_storage_state()) is True
+        assert json.loads(browser.state_path.read_text(encoding="utf-8")) == {"cookies": rotated, "origins": []}
+        assert asyncio.run(browser._persist_storage_state()) is False
+        assert not browser.state_path.with_name(browser.state_path.name + ".tmp").exists()
+    finally:
+        cookies_path.unlink(missing_ok=True)
+        browser.state_path.unlink(missing_ok=True)
+
+
+def test_saved_storage_state_seeds_context_instead_of_cookie_file():
+    cookies_path = write_cookies_file()
+    browser = LinkedInBrowser(cookies_path=cookies_path)
+    state = {
+        "cookies": [{"name": "li_at", "value": "saved", "domain": ".linkedin.com", "path": "/"}],
+        "origins": [{"origin": "https://www.linkedin.com", "localStorage": []}],
+    }
+    browser.state_path.write_text(json.dumps(state), encoding="utf-8")
+    try:
+        context = make_context()
+        starter, launched = make_launch_stub(context)
+
+        async def run():
+            with patch("src.scrapers.linkedin_browser.async_playwright", return_value=starter):
+                async with browser:
+                    assert browser.diagnostics["cookies_loaded"] == 1
+
+        asyncio.run(run())
+
+        assert launched.new_context.await_args.kwargs["storage_state"] == state
+        context.add_cookies.assert_not_awaited()
+    finally:
+        cookies_path.unlink(missing_ok=True)
+        browser.state_path.unlink(missing_ok=True)
+
+
+def test_newer_cookie_file_supersedes_a_stale_storage_state():
+    cookies_path = write_cookies_file()
+    browser = LinkedInBrowser(cookies_path=cookies_path)
+    stale = {"cookies": [{"name": "li_at", "value": "expired", "domain": ".linkedin.com", "path": "/"}]}
+    browser.state_path.write_text(json.dumps(stale), encoding="utf-8")
+    state_mtime = browser.state_path.stat().st_mtime
+    os.utime(cookies_path, (state_mtime + 60, state_mtime + 60))
+    try:
+        context = make_context()
+        starter, launched = make_launch_stub(context)
+
+        async def run():
+            with patch("src.scrapers.linkedin_browser.async_playwright", return_value=starter):
+                async with browser:
+                    pass
+
+        asyncio.run(run())
+
+        assert "storage_state" not in launched.new_context.await_args.kwargs
+        assert context.add_cookies.await_args.args[0][0]["value"] == "token"
+    finally:
+        cookies_path.unlink(missing_ok=True)
+        browser.state_path.unlink(missing_ok=True)
+
+
+def test_expired_storage_state_falls_back_to_cookie_file():
+    cookies_path = write_cookies_file()
+    browser = make_preflight_browser(200)
+    browser.cookies_path = cookies_path
+    expired = MagicMock(status=302, headers={"location": "https://www.linkedin.com/uas/login"}, dispose=AsyncMock())
+    ok = browser.context.request.get.return_value
+    browser.context.request.get = AsyncMock(side_effect=[expired, ok])
+    browser.context.add_cookies = AsyncMock()
+    browser._storage_state = {"cookies": [{"name": "li_at", "value": "expired", "domain": ".linkedin.com"}]}
+    browser._context_seeded = True
+    try:
+        assert asyncio.run(browser.validate_session()) is True
+    finally:
+        cookies_path.unlink(missing_ok=True)
+
+    assert browser._storage_state is None
+    assert browser.context.add_cookies.await_args.args[0][0]["value"] == "token"
+    assert browser.diagnostics["session_status"] == "ok"
+
+
+def test_url_key_uses_job_id_and_falls_back_to_hash():
+    assert url_key("https://www.linkedin.com/jobs/view/4012345678/") == 4012345678
+    assert url_key("https://www.linkedin.com/jobs/view/4012345678") == url_key(
+        "https://nl.linkedin.com/jobs/view/4012345678/"
+    )
+    other = url_key("https://www.linkedin.com/company/acme")
+    assert isinstance(other, int) and other < 2**64
+    assert other == url_key("https://www.linkedin.com/company/acme")
+
+
+def test_persistent_profile_context_is_closed_and_gets_cookies_injected():
+    cookies_path = write_cookies_file()
+    profile_dir = Path(__file__).resolve().parent / "linkedin_test_profile"
+    try:
+        context = MagicMock()
+        context.add_cookies = AsyncMock()
+        context.route = AsyncMock()
+        context.add_init_script = AsyncMock()
+        context.new_page = AsyncMock(return_value=MagicMock())
+        context.close = AsyncMock()
+        playwright = MagicMock()
+        playwright.chromium.launch_persistent_context = AsyncMock(return_value=context)
+        playwright.stop = AsyncMock()
+        starter = MagicMock()
+        starter.start = AsyncMock(return_value=playwright)
+
+        async def run():
+            with patch("src.scrapers.linkedin_browser.async_playwright", return_value=starter):
+                async with LinkedInBrowser(cookies_path=cookies_path, user_data_dir=profile_dir) as browser:
+                    assert browser.browser is None
+
+        asyncio.run(run())
+
+        assert playwright.chromium.launch_persistent_context.await_args.args == (str(profile_dir),)
+        context.add_cookies.assert_awaited_once()
+        context.close.assert_awaited_once()
+        playwright.stop.assert_awaited_once()
+    finally:
+        cookies_path.unlink(missing_ok=True)
+        if profile_dir.exists():
+            profile_dir.rmdir()
+
+
+def test_ws_endpoint_connects_to_running_browser_server_instead_of_launching():
+    cookies_path = write_cookies_file()
+    try:
+        context = MagicMock()
+        context.add_cookies = AsyncMock()
+        context.route = AsyncMock()
+        context.add_init_script = AsyncMock()
+        context.new_page = AsyncMock(return_value=MagicMock())
+        remote_browser = MagicMock()
+        remote_browser.new_context = AsyncMock(return_value=context)
+        remote_browser.close = AsyncMock()
+        playwright = MagicMock()
+        playwright.chromium.connect = AsyncMock(return_value=remote_browser)
+        playwright.chromium.launch = AsyncMock()
+        playwright.stop = AsyncMock()
+        starter = MagicMock()
+        starter.start = AsyncMock(return_value=playwright)
+
+        async def run():
+            with patch("src.scrapers.linkedin_browser.async_playwright", return_value=starter):
+                async with LinkedInBrowser(cookies_path=cookies_path, ws_endpoint="ws://127.0.0.1:3000/pw"):
+                    pass
+
+        asyncio.run(run())
+
+        playwright.chromium.connect.assert_awaited_once_with("ws://127.0.0.1:3000/pw")
+        playwright.chromium.launch.assert_not_awaited()
+        context.add_cookies.assert_awaited_once()
+        remote_browser.close.assert_awaited_once()
+    finally:
+        cookies_path.unlink(missing_ok=True)
+
+
+def test_ws_endpoint_with_user_data_dir_warns_that_the_profile_is_ignored(caplog):
+    with caplog.at_level("WARNING", logger="src.scrapers.linkedin_browser"):
+        LinkedInBrowser(ws_endpoint="ws://127.0.0.1:3000/pw", user_data_dir=Path("profile"))
+
+    assert "ignoring user_data_dir" in caplog.text
+
+
+def make_preflight_browser(status: int, location: str = "") -> LinkedInBrowser:
+    browser = LinkedInBrowser()
+    response = MagicMock()
+    response.status = status
+    response.headers = {"location": location} if location else {}
+    response.dispose = AsyncMock()
+    browser.context = MagicMock()
+    browser.context.request.get = AsyncMock(return_value=response)
+    browser.page = MagicMock()
+    browser.page.goto = AsyncMock()
+    return browser
+
+
+def test_validate_session_accepts_feed_without_rendering_it():
+    browser = make_preflight_browser(200)
+
+    assert asyncio.run(browser.validate_session()) is True
+
+    assert browser.diagnostics["session_status"] == "ok"
+    browser.context.request.get.assert_awaited_once_with(
+        "https://www.linkedin.com/feed/", max_redirects=0, timeout=15000
+    )
+    browser.page.goto.assert_not_awaited()
+
+
+def test_validate_session_maps_login_and_challenge_redirects():
+    expired = make_preflight_browser(302, "https://www.linkedin.com/uas/login?session_redirect=%2Ffeed%2F")
+    with pytest.raises(LinkedInSessionError):
+        asyncio.run(expired.validate_session())
+    assert expired.diagnostics["session_status"] == "auth_redirect"
+
+    challenged = make_preflight_browser(303, "https://www.linkedin.com/checkpoint/challenge/AgE")
+    with pytest.raises(LinkedInCaptchaError):
+        asyncio.run(challenged.validate_session())
+    assert challenged.diagnostics["session_status"] == "challenge"
+    challenged.page.goto.assert_not_awaited()
+
+
+def test_navigations_are_capped_across_concurrent_pages():
+    browser = LinkedInBrowser(max_concurrent_navigations=1)
+    in_flight = 0
+    peak = 0
+
+    def make_page():
+        page = MagicMock()
+        page.url = "https://www.linkedin.com/jobs/search?keywords=data"
+
+        async def goto(url, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+
+        page.goto = goto
+        page.inner_text = AsyncMock(return_value="")
+        return page
+
+    async def run():
+        await asyncio.gather(
+            *(browser._goto("https://www.linkedin.com/jobs/search", timeout=1000, page=make_page()) for _ in range(3))
+        )
+
+    asyncio.run(run())
+
+    assert peak == 1
+
+
+def test_card_selector_is_memoized_after_first_reveal():
+    browser = LinkedInBrowser()
+    page = MagicMock()
+    page.evaluate = AsyncMock(
+        side_effect=[
+            {"selector": "li[data-occludable-job-id]", "total": 25},
+            [{"title": "Data Engineer", "url": "/jobs/view/4012345678/"}],
+        ]
+    )
+
+    async def run():
+        await browser._scroll_to_reveal_all_cards(page)
+        return await browser._extract_cards(page)
+
+    cards = asyncio.run(run())
+
+    assert browser._card_selector == "li[data-occludable-job-id]"
+    assert page.evaluate.await_args_list[1].args[1] == ["li[data-occludable-job-id]"]
+    assert cards[0]["url"] == "https://www.linkedin.com/jobs/view/4012345678"
+
+
+def test_logged_in_detail_returns_json_ld_without_waiting_for_render():
+    browser = LinkedInBrowser()
+    page = MagicMock()
+    page.url = "https://www.linkedin.com/jobs/view/4012345678/"
+    page.goto = AsyncMock()
+    page.inner_text = AsyncMock(return_value="")
+    # Challenge probe after navigation, then the JSON-LD read.
+    page.evaluate = AsyncMock(side_effect=[None, "<p>Build data pipelines</p>"])
+    page.wait_for_selector = AsyncMock()
+
+    payload = asyncio.run(
+        browser._fetch_logged_in_description(page, "https://www.linkedin.com/jobs/view/4012345678/")
+    )
+
+    assert payload["json_ld_description"] == "<p>Build data pipelines</p>"
+    assert page.evaluate.await_count == 2
+    page.wait_for_selector.assert_not_awaited()
+
+
+def test_guest_description_is_fetched_over_http_without_opening_a_tab():
+    browser = LinkedInBrowser()
+    response = MagicMock()
+    response.status = 200
+    response.text = AsyncMock(
+        return_value='<div class="show-more-less-html__markup"><p>Own the lakehouse</p></div>'
+    )
+    response.dispose = AsyncMock()
+    browser.context = MagicMock()
+    browser.context.request.get = AsyncMock(return_value=response)
+    browser.context.new_page = AsyncMock()
+
+    payload = asyncio.run(browser.fetch_job_description("https://www.linkedin.com/jobs/view/4012345678/"))
+
+    assert payload["detail_html"] == "<p>Own the lakehouse</p>"
+    assert browser.context.request.get.await_args.args == (
+        "https://www.linkedin.com/jobs-guest/jobs/api/jobPosting/4012345678",
+    )
+    browser.context.new_page.assert_not_awaited()
+    response.dispose.assert_awaited_once()
+
+
+def test_guest_429_halves_the_adaptive_cap_and_clean_responses_grow_it():
+    browser = LinkedInBrowser(max_concurrent_navigations=4)
+    limited = MagicMock(status=429, dispose=AsyncMock())
+    ok = MagicMock(status=200, dispose=AsyncMock())
+    ok.text = AsyncMock(return_value='<div class="description__text"><p>JD</p></div>')
+    browser.context = MagicMock()
+    browser.context.request.get = AsyncMock(side_effect=[limited, ok, ok])
+    url = "https://www.linkedin.com/jobs/view/4012345678/"
+
+    assert asyncio.run(browser._fetch_guest_description(url))["detail_html"] == ""
+    assert browser._guest_slots.limit == 2
+    assert browser.diagnostics["guest_rate_limited"] == 1
+
+    for _ in range(2):
+        assert asyncio.run(browser._fetch_guest_description(url))["detail_html"] == "<p>JD</p>"
+    assert browser._guest_slots.limit == 3
+    limited.dispose.assert_awaited_once()
+
+
+def test_search_pages_after_the_first_load_concurrently_and_merge_in_order():
+    browser = LinkedInBrowser()
+    in_flight = 0
+    peak = 0
+
+    async def load_search_page(search_url, page_index, trace=None):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01 * (4 - page_index))
+        in_flight -= 1
+        if page_index == 2:
+            return [{"url": f"https://www.linkedin.com/jobs/view/{page_index * 100 + n}"} for n in range(3)]
+        if page_index == 3:
+            return [{"url": "https://www.linkedin.com/jobs/view/1"}]
+        return [{"url": f"https://www.linkedin.com/jobs/view/{page_index * 100 + n}"} for n in range(25)]
+
+    browser._load_search_page = load_search_page
+
+    cards = asyncio.run(browser.search_jobs("data engineer", location="Netherlands", max_jobs=0))
+
+    assert peak == 3
+    ids = [int(card["url"].rsplit("/", 1)[-1]) for card in cards]
+    # Page 4 comes after the short page 3, so its card is dropped.
+    assert ids == list(range(25)) + list(range(100, 125)) + [200, 201, 202]
+
+
+def test_short_first_search_page_loads_no_further_pages():
+    browser = LinkedInBrowser()
+    calls = []
+
+    async def load_search_page(search_url, page_index, trace=None):
+        calls.append(page_index)
+        return [{"url": f"https://www.linkedin.com/jobs/view/{n}"} for n in range(1, 6)]
+
+    browser._load_search_page = load_search_page
+
+    trace = {}
+    cards = asyncio.run(browser.search_jobs("data engineer", location="Netherlands", max_jobs=100, trace=trace))
+
+    assert calls == [0]
+    assert len(cards) == 5
+    assert trace == {"last_stage": "search", "cards_found": 5}
+
+
+def test_page_helpers_are_all_defined_at_top_level():
+    lines = PAGE_HELPERS_SCRIPT.strip().splitlines()
+    code_lines = [line for line in lines if not line.startswith("//")]
+
+    for index, line in enumerate(code_lines):
+        if "window.__jh" in line and " = " in line.split("=>")[0]:
+            assert line.startswith("window.__jh"), line
+            assert index == 0 or code_lines[index - 1] == "};", line
@@ -1,3 +1,4 @@
+import asyncio
 import importlib
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -71,7 +72,9 @@ class FakeLinkedInBrowser:
             raise self.session_error
         return True
 
-    async def search_jobs(self, keywords: str, **kwargs) -> list[dict]:
+    async def search_jobs(self, keywords: str, *, trace: dict | None = None, **kwargs) -> list[dict]:
+        if trace is not None:
+            trace["last_url"] = f"https://www.linkedin.com/jobs/search?keywords={keywords}"
         failure = self.failures_by_query.get(keywords)
         if failure:
             raise failure
@@ -278,10 +281,156 @@ def test_orchestrator_emits_structured_linkedin_diagnostics(mock_db_cls, mock_bl
                 "status": "ok",
                 "cards_found": 0,
                 "jobs_enriched": 0,
-                "last_stage": "detail_fetch",
-                "last_url": "https://www.linkedin.com/jobs/view/123",
+                "last_stage": "search",
+                "last_url": 'https://www.linkedin.com/jobs/search?keywords="MLOps Engineer"',
                 "error": "",
             },
         ]
     finally:
         config_path.unlink(missing_ok=True)
+
+
+class ConcurrencyTrackingBrowser(FakeLinkedInBrowser):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def search_jobs(self, keywords: str, **kwargs) -> list[dict]:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        return await super().search_jobs(keywords, **kwargs)
+
+
+@patch("src.scrapers.base.load_blacklists", return_value={"company": [], "title": []})
+@patch("src.scrapers.base.JobDatabase")
+def test_orchestrator_runs_queries_concurrently_up_to_configured_limit(mock_db_cls, mock_bl):
+    linkedin = load_linkedin_module()
+    config_path = write_search_profiles(Path(__file__).resolve().parent)
+    try:
+        mock_db_cls.return_value = MagicMock(find_existing_job_ids=MagicMock(return_value=set()))
+        browser = ConcurrencyTrackingBrowser(
+            search_results_by_query={
+                '"Data Engineer"': [],
+                '"MLOps Engineer"': [],
+                '"ML Engineer"': [],
+            }
+        )
+
+        scraper = linkedin.LinkedInScraper(profile=None, browser=browser, config_path=config_path)
+        scraper.config["defaults"]["query_concurrency"] = 2
+        report = scraper.run(dry_run=True)
+
+        assert browser.max_in_flight == 2
+        assert [item["query"] for item in report.diagnostics["queries"]] == [
+            '"Data Engineer"',
+            '"MLOps Engineer"',
+            '"ML Engineer"',
+        ]
+    finally:
+        config_path.unlink(missing_ok=True)
+
+
+@patch("src.scrapers.base.load_blacklists", return_value={"company": [], "title": []})
+@patch("src.scrapers.base.JobDatabase")
+def test_orchestrator_stops_queued_queries_after_session_loss(mock_db_cls, mock_bl):
+    linkedin = load_linkedin_module()
+    config_path = write_search_profiles(Path(__file__).resolve().parent)
+    try:
+        mock_db_cls.return_value = MagicMock(find_existing_job_ids=MagicMock(return_value=set()))
+        browser = FakeLinkedInBrowser(
+            failures_by_query={'"Data Engineer"': linkedin.LinkedInSessionError("logged out")},
+        )
+
+        scraper = linkedin.LinkedInScraper(profile="data_engineering", browser=browser, config_path=config_path)
+        scraper.config["defaults"]["query_concurrency"] = 1
+        report = scraper.run(dry_run=True)
+
+        assert report.targets_attempted == 1
+        assert report.target_errors == [{"target": '"Data Engineer"', "error": "logged out"}]
+        assert [item["query"] for item in report.diagnostics["queries"]] == ['"Data Engineer"']
+    finally:
+        config_path.unlink(missing_ok=True)
+
+
+@patch("src.scrapers.base.load_blacklists", return_value={"company": ["hays"], "title": []})
+@patch("src.scrapers.base.JobDatabase")
+def test_orchestrator_skips_detail_fetch_for_blacklisted_cards(mock_db_cls, mock_bl):
+    linkedin = load_linkedin_module()
+    config_path = write_search_profiles(Path(__file__).resolve().parent)
+    try:
+        db = MagicMock()
+        db.find_existing_job_ids.return_value = set()
+        mock_db_cls.return_value = db
+
+        browser = FakeLinkedInBrowser(
+            search_results_by_query={
+                '"Data Engineer"': [
+                    {
+                        "title": "Data Engineer",
+                        "company": "Hays Netherlands",
+                        "location": "Amsterdam",
+                        "url": "https://www.linkedin.com/jobs/view/999",
+                    }
+                ],
+            },
+        )
+        browser.fetch_job_description = AsyncMock(return_value={})
+
+        scraper = linkedin.LinkedInScraper(profile="data_engineering", browser=browser, config_path=config_path)
+        report = scraper.run(dry_run=True)
+
+        assert report.found == 1
+        assert report.skipped_blacklist == 1
+        assert report.would_insert == 0
+        browser.fetch_job_description.assert_not_awaited()
+    finally:
+        config_path.unlink(missing_ok=True)
+
+
+@patch("src.scrapers.base.load_blacklists", return_value={"company": [], "title": []})
+@patch("src.scrapers.base.JobDatabase")
+def test_browser_cdp_url_default_attaches_over_cdp(mock_db_cls, mock_bl):
+    linkedin = load_linkedin_module()
+    config_path = write_search_profiles(Path(__file__).resolve().parent)
+    try:
+        config = yaml.safe_load(config_path.read_text(encoding="utf-8"))
+        config["defaults"]["browser_cdp_url"] = "http://localhost:9333"
+        config_path.write_text(yaml.safe_dump(config), encoding="utf-8")
+
+        scraper = linkedin.LinkedInScraper(profile="data_engineering", config_path=config_path)
+
+        assert scraper.browser.use_cdp is True
+        assert scraper.browser.cdp_url == "http://localhost:9333"
+    finally:
+        config_path.unlink(missing_ok=True)
+
+
+@patch("src.scrapers.base.load_blacklists", return_value={"company": [], "title": []})
+@patch("src.scrapers.base.JobDatabase")
+def test_orchestrator_only_probes_db_for_cards_no_earlier_query_classified(mock_db_cls, mock_bl):
+    linkedin = load_linkedin_module()
+    config_path = write_search_profiles(Path(__file__).resolve().parent)
+    try:
+        db = MagicMock()
+        db.find_existing_job_ids.return_value = set()
+        mock_db_cls.return_value = db
+        card = {
+            "title": "Data Engineer",
+            "company": "Acme",
+            "location": "Amsterdam",
+            "url": "https://www.linkedin.com/jobs/view/123",
+        }
+        browser = FakeLinkedInBrowser(
+            search_results_by_query={'"Data Engineer"': [card], '"MLOps Engineer"': [card]},
+        )
+
+        scraper = linkedin.LinkedInScraper(profile="data_engineering", browser=browser, config_path=config_path)
+        asyncio.run(scraper._scrape_async())
+
+        probed = sorted(call.args[0] for call in db.find_existing_job_ids.call_args_list)
+        assert probed == [[], ["https://www.linkedin.com/jobs/view/123"]]
+    finally:
+        config_path.unlink(missing_ok=True)
@@ -43,3 +43,66 @@ def test_parser_extracts_job_description_from_inputs():
     )
 
     assert "Build ML systems." in description
+
+
+def test_canonical_job_url_collapses_linkedin_surfaces_to_one_posting_url():
+    parser = load_linkedin_parser_module()
+    expected = "https://www.linkedin.com/jobs/view/4012345678"
+
+    assert parser.canonical_job_url("/jobs/view/4012345678/?refId=abc&trackingId=xyz") == expected
+    assert parser.canonical_job_url("https://nl.linkedin.com/jobs/view/data-engineer-at-acme-4012345678") == expected
+    assert parser.canonical_job_url(
+        "https://www.linkedin.com/jobs/collections/recommended/?currentJobId=4012345678"
+    ) == expected
+    assert parser.canonical_job_url("/company/acme/?trk=x#top") == "https://www.linkedin.com/company/acme"
+    assert parser.linkedin_job_id("https://www.linkedin.com/company/acme") is None
+
+
+def test_parser_carries_card_posted_datetime_as_posted_date():
+    parser = load_linkedin_parser_module()
+
+    jobs = parser.parse_search_cards(
+        [
+            {
+                "title": "Data Engineer",
+                "company": "Acme",
+                "location": "Amsterdam",
+                "url": "https://www.linkedin.com/jobs/view/123",
+                "posted": "2026-10-17",
+            }
+        ]
+    )
+
+    assert jobs[0]["posted_date"] == "2026-10-17"
+
+
+def test_extract_first_class_html_prefers_class_order_over_document_order():
+    parser = load_linkedin_parser_module()
+    fragment = (
+        '<section><div class="description__text description__text--rich">'
+        '<div class="show-more-less-html__markup relative">'
+        "<p>Build <strong>pipelines</strong> &amp; models<br>Python</p><img src=\"x\"></div>"
+        "</div></section>"
+    )
+
+    html = parser.extract_first_class_html(
+        fragment, ("show-more-less-html__markup", "description__text--rich")
+    )
+
+    assert html == '<p>Build <strong>pipelines</strong> &amp; models<br>Python</p><img src="x">'
+    assert parser.extract_job_description({"detail_html": html}) == "Build pipelines & models\nPython"
+    assert parser.extract_first_class_html("<div class='other'>x</div>", ("description__text",)) == ""
+
+
+def test_extract_first_class_html_ignores_stray_and_missing_end_tags():
+    parser = load_linkedin_parser_module()
+    classes = ("show-more-less-html__markup",)
+
+    stray = '<div class="show-more-less-html__markup"><p>a</p></p>more text</div>'
+    assert parser.extract_first_class_html(stray, classes) == "<p>a</p></p>more text"
+
+    unclosed = (
+        '<div class="show-more-less-html__markup"><ul><li>SQL<li>Python</ul><p>Remote'
+        '</div><div class="similar-jobs"><div>Other role</div></div>'
+    )
+    assert parser.extract_first_class_html(unclosed, classes) == "<ul><li>SQL<li>Python</ul><p>Remote"
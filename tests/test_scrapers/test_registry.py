@@ -1,4 +1,7 @@
 import importlib
+import subprocess
+import sys
+from pathlib import Path
 
 import pytest
 
@@ -21,3 +24,24 @@ def test_get_scraper_class_rejects_aliases():
 
     with pytest.raises(ValueError, match="does not map to a single scraper class"):
         registry.get_scraper_class("all")
+
+
+def test_importing_registry_defers_scraper_modules():
+    project_root = Path(__file__).resolve().parents[2]
+    probe = (
+        "import sys, src.scrapers.registry; "
+        "print(any(m in sys.modules for m in ('playwright', 'requests', 'src.db.job_db')))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", probe], cwd=project_root, capture_output=True, text=True, check=True
+    )
+
+    assert result.stdout.strip() == "False"
+
+
+def test_package_exports_resolve_lazily():
+    scrapers = importlib.import_module("src.scrapers")
+
+    assert scrapers.GreenhouseScraper.__name__ == "GreenhouseScraper"
+    with pytest.raises(AttributeError):
+        scrapers.NotAScraper
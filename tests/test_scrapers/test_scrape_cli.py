@@ -1,4 +1,5 @@
 import importlib.util
+import threading
 from pathlib import Path
 
 import pytest
@@ -64,6 +65,7 @@ def test_run_platforms_logs_elapsed_time(monkeypatch):
         profile="data_engineering",
         save_to_db=False,
         dry_run=True,
+        max_workers=1,
     )
 
     assert reports == {
@@ -85,6 +87,56 @@ def test_run_platforms_logs_elapsed_time(monkeypatch):
     ]
 
 
+def test_run_platforms_runs_platforms_concurrently(monkeypatch):
+    scrape = load_scrape_module()
+    barrier = threading.Barrier(3, timeout=5)
+
+    class BlockingScraper:
+        def __init__(self, platform: str):
+            self.platform = platform
+
+        def run(self, dry_run: bool = False):
+            barrier.wait()  # Deadlocks (and times out) unless all three run at once
+            return {"source": self.platform}
+
+    monkeypatch.setattr(scrape, "build_scraper", lambda platform, profile=None: BlockingScraper(platform))
+    monkeypatch.setattr(scrape, "serialize_report", lambda report: dict(report))
+
+    reports = scrape.run_platforms(
+        platforms=["linkedin", "greenhouse", "iamexpat"],
+        profile=None,
+        save_to_db=False,
+        dry_run=True,
+    )
+
+    assert list(reports) == ["linkedin", "greenhouse", "iamexpat"]
+    assert all(report["source"] == platform for platform, report in reports.items())
+
+
+def test_run_platforms_builds_every_scraper_before_fanning_out(monkeypatch):
+    scrape = load_scrape_module()
+    build_threads = []
+
+    class DummyScraper:
+        def __init__(self, platform: str):
+            self.platform = platform
+
+        def run(self, dry_run: bool = False):
+            return {"source": self.platform}
+
+    def build_scraper(platform, profile=None):
+        build_threads.append(threading.get_ident())
+        return DummyScraper(platform)
+
+    monkeypatch.setattr(scrape, "build_scraper", build_scraper)
+    monkeypatch.setattr(scrape, "serialize_report", lambda report: dict(report))
+
+    scrape.run_platforms(platforms=["linkedin", "greenhouse", "iamexpat"], profile=None, save_to_db=False, dry_run=True)
+
+    # JobDatabase migrations run during construction, so it must not happen on pool threads.
+    assert build_threads == [threading.get_ident()] * 3
+
+
 def test_emit_metrics_preserves_platform_diagnostics():
     scrape = load_scrape_module()
     output_path = Path(__file__).resolve().parent / "tmp_scrape_metrics.json"